@@ -0,0 +1,4 @@
+"""
+Mosaic Vault - Agents
+The Governor (risk engine) and the Scout (forensic analyst).
+"""
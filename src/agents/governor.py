@@ -377,6 +377,27 @@ class Governor:
             logger.info("Falling back to mock data")
             return self._get_mock_holdings()
     
+    def get_current_portfolio(self, access_token=None) -> Tuple[float, List[Holding]]:
+        """Live holdings and their total market value"""
+        holdings = self.fetch_live_holdings(access_token)
+        return sum(h.value for h in holdings), holdings
+    
+    def get_portfolio_status(self, portfolio_value: float) -> Dict:
+        """
+        Risk zone of a portfolio value against the recorded peak.
+        Read-only: unlike audit_risk, nothing is written to the database.
+        """
+        peak_value = max(self.cppi._get_peak_value(), portfolio_value)
+        drawdown_pct = self.cppi._calculate_drawdown(portfolio_value, peak_value)
+        floor_value = peak_value * self.cppi.floor_ratio
+        
+        return {
+            'risk_zone': self.cppi._determine_risk_zone(drawdown_pct).value,
+            'drawdown_pct': drawdown_pct * 100,
+            'floor_value': floor_value,
+            'floor_protection': portfolio_value >= floor_value
+        }
+    
     def _get_current_price(self, symbol: str) -> float:
         """Get current price from yfinance (free data source)"""
         try:
@@ -404,16 +425,20 @@ class Governor:
             Holding("INFY", 15, 1400.0, 1420.0, 21300.0, 20.0, 1.4, 300.0, 2.1),
         ]
     
-    def audit_risk(self, access_token=None) -> Dict:
+    def audit_risk(self, access_token=None, holdings: Optional[List[Holding]] = None) -> Dict:
         """
         Main risk audit function - The Governor's core responsibility
         
+        Args:
+            holdings: Already-fetched holdings to audit instead of fetching them again
+        
         Returns:
             Dict: Complete risk assessment and recommendations
         """
         try:
             # Fetch current holdings
-            holdings = self.fetch_live_holdings(access_token)
+            if holdings is None:
+                holdings = self.fetch_live_holdings(access_token)
             
             # Calculate total portfolio value
             total_value = sum(holding.value for holding in holdings)
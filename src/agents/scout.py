@@ -9,6 +9,8 @@ import json
 import os
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union
 from dataclasses import dataclass
@@ -53,9 +55,22 @@ class GeminiCLI:
         self.cli_command = "gemini"  # Assumes Gemini CLI is installed and configured
         self.rate_limit_delay = 1.0  # Delay between calls to respect rate limits
         self.last_call_time = 0.0
+        self._rate_lock = threading.Lock()  # Parallel analyses still share one rate limit
+        self.cli_recheck_interval = 60.0  # Seconds before a missing CLI is looked for again
+        self._cli_available = False
+        self._cli_checked_at = float('-inf')
         
     def _check_cli_availability(self) -> bool:
-        """Check if Gemini CLI is available and authenticated"""
+        """
+        Check if Gemini CLI is available and authenticated.
+        A working CLI is remembered for the process; a missing one is re-checked
+        at most once per cli_recheck_interval instead of spawning a process per prompt.
+        """
+        if self._cli_available:
+            return True
+        if time.time() - self._cli_checked_at < self.cli_recheck_interval:
+            return False
+        
         try:
             result = subprocess.run(
                 [self.cli_command, "--version"],
@@ -63,20 +78,24 @@ class GeminiCLI:
                 text=True,
                 timeout=10
             )
-            return result.returncode == 0
+            self._cli_available = result.returncode == 0
         except (subprocess.SubprocessError, FileNotFoundError):
-            return False
+            self._cli_available = False
+        
+        self._cli_checked_at = time.time()
+        return self._cli_available
     
     def _rate_limit(self) -> None:
         """Implement rate limiting to stay within free tier"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_call_time
-        
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            time.sleep(sleep_time)
-        
-        self.last_call_time = time.time()
+        with self._rate_lock:
+            current_time = time.time()
+            time_since_last = current_time - self.last_call_time
+            
+            if time_since_last < self.rate_limit_delay:
+                sleep_time = self.rate_limit_delay - time_since_last
+                time.sleep(sleep_time)
+            
+            self.last_call_time = time.time()
     
     def run_analysis(self, prompt: str, format_type: str = "json") -> Dict:
         """
@@ -221,6 +240,34 @@ class Scout:
                 data_sources=[]
             )
     
+    def analyze_batch(self, tickers: List[str], trigger_event: str = "price_drop",
+                      context: Dict = None, max_workers: int = 4) -> List[AnalysisResult]:
+        """
+        Analyze several tickers in one call
+        
+        Market data fetches for different tickers overlap on a small thread pool;
+        Gemini calls still go through the shared rate limit.
+        
+        Args:
+            tickers: Stock symbols to analyze (duplicates are analyzed once)
+            trigger_event: What triggered the analysis
+            context: Additional context applied to every ticker
+            max_workers: Maximum tickers analyzed concurrently
+            
+        Returns:
+            List[AnalysisResult]: One result per unique ticker, in request order
+        """
+        unique_tickers = list(dict.fromkeys(tickers))
+        if not unique_tickers:
+            return []
+        
+        logger.info(f"Scout batch analysis of {len(unique_tickers)} tickers - Trigger: {trigger_event}")
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_tickers))) as pool:
+            return list(pool.map(
+                lambda ticker: self.analyze_ticker(ticker, trigger_event, context),
+                unique_tickers
+            ))
+    
     def _gather_market_data(self, ticker: str) -> Dict:
         """Gather market data using free sources"""
         try:
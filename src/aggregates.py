@@ -0,0 +1,76 @@
+"""
+Mosaic Vault - Portfolio Aggregates
+Single-pass reductions over struct-of-arrays holding columns.
+Compiled with Numba when it is installed, NumPy reductions otherwise.
+"""
+
+import logging
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy path gives identical results
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+def _portfolio_stats_loop(quantity, avg_price, day_change, pnl, pnl_pct):
+    """
+    Sweep the holding columns once and return
+    (total_investment, day_pnl, gainers_count, losers_count, top_gainer_idx, top_loser_idx).
+    Top indexes are -1 when there are no gainers/losers; ties keep the first holding.
+    """
+    total_investment = 0.0
+    day_pnl = 0.0
+    gainers_count = 0
+    losers_count = 0
+    top_gainer = -1
+    top_loser = -1
+    
+    for i in range(quantity.shape[0]):
+        total_investment += quantity[i] * avg_price[i]
+        day_pnl += quantity[i] * day_change[i]
+        if pnl[i] > 0:
+            gainers_count += 1
+            if top_gainer < 0 or pnl_pct[i] > pnl_pct[top_gainer]:
+                top_gainer = i
+        elif pnl[i] < 0:
+            losers_count += 1
+            if top_loser < 0 or pnl_pct[i] < pnl_pct[top_loser]:
+                top_loser = i
+    
+    return total_investment, day_pnl, gainers_count, losers_count, top_gainer, top_loser
+
+def _portfolio_stats_numpy(quantity, avg_price, day_change, pnl, pnl_pct):
+    """NumPy equivalent of _portfolio_stats_loop for installs without Numba"""
+    gainers = pnl > 0
+    losers = pnl < 0
+    top_gainer = int(np.argmax(np.where(gainers, pnl_pct, -np.inf))) if gainers.any() else -1
+    top_loser = int(np.argmin(np.where(losers, pnl_pct, np.inf))) if losers.any() else -1
+    
+    return (
+        float(quantity @ avg_price),
+        float(quantity @ day_change),
+        int(gainers.sum()),
+        int(losers.sum()),
+        top_gainer,
+        top_loser
+    )
+
+if njit is not None:
+    portfolio_stats = njit(cache=True)(_portfolio_stats_loop)
+else:
+    portfolio_stats = _portfolio_stats_numpy
+
+def warm_up() -> None:
+    """
+    Compile portfolio_stats ahead of the first request (no-op without Numba).
+    Callers must pass C-contiguous float64 columns, the only layout compiled here.
+    """
+    if njit is None:
+        return
+    
+    sample = np.zeros(1, dtype=np.float64)
+    portfolio_stats(sample, sample, sample, sample, sample)
+    logger.debug("portfolio_stats kernel compiled")
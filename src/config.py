@@ -4,6 +4,8 @@ Handles environment variables and system configuration.
 """
 
 import os
+import time
+import functools
 from typing import Dict, Optional, Union
 from dataclasses import dataclass
 from dotenv import load_dotenv
@@ -169,8 +171,12 @@ class Config:
         return f"sqlite:///{self.system.database_path}"
     
     def is_market_hours(self) -> bool:
-        """Check if current time is within market hours"""
-        from datetime import datetime, time
+        """Check if current time is within market hours (re-evaluated at most once a minute)"""
+        return _market_hours_cached(self, int(time.time()) // 60)
+    
+    def _check_market_hours(self) -> bool:
+        """Compare the current time against the configured market open/close times"""
+        from datetime import datetime
         
         now = datetime.now().time()
         open_time = datetime.strptime(self.system.market_open_time, "%H:%M").time()
@@ -205,6 +211,11 @@ class Config:
             }
         }
 
+@functools.lru_cache(maxsize=2)
+def _market_hours_cached(cfg: Config, minute_bucket: int) -> bool:
+    """Memoize the market-hours check per (config, minute) so polling endpoints skip the time parsing"""
+    return cfg._check_market_hours()
+
 # Global configuration instance
 config = Config()
 
@@ -0,0 +1,4 @@
+"""
+Mosaic Vault - Core
+Authentication, notification and web helpers shared by the agents and dashboards.
+"""
@@ -7,11 +7,20 @@ Zero Opex Design: Uses personal plan, automated 2FA, secure local storage.
 import os
 import time
 import logging
+import functools
 from typing import Optional
 import onetimepass as otp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from kiteconnect import KiteConnect
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # Fall back to requests' stdlib JSON decoding
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -24,6 +33,57 @@ if not logger.handlers:
     logger.addHandler(handler)
     logger.setLevel(logging.INFO)
 
+def _orjson_response_hook(response, *args, **kwargs):
+    """requests response hook: decode the Kite API body with orjson when .json() is called"""
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+def _build_kite_http() -> requests.Session:
+    """Keep-alive session with a connection pool and retries on Kite gateway errors"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        # raise_on_status=False: once retries run out, hand the last 5xx response to kiteconnect
+        # so it raises its own exception types instead of requests' RetryError
+        max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504],
+                          raise_on_status=False)
+    )
+    session.mount('https://', adapter)
+    if orjson is not None:
+        session.hooks['response'].append(_orjson_response_hook)
+    return session
+
+# Shared by every KiteConnect client in the process so TLS connections are reused
+_KITE_HTTP = _build_kite_http()
+
+def _drop_inherited_connections() -> None:
+    """
+    After fork (e.g. gunicorn --preload), discard the pooled connections copied from the
+    parent so no two processes share a TLS socket; the child's pools refill on first use.
+    """
+    _KITE_HTTP.close()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_drop_inherited_connections)
+
+def _patch_kite_client() -> None:
+    """
+    Route every KiteConnect client through the shared _KITE_HTTP session.
+    KiteConnect builds its own requests.Session per instance and has no
+    parameter to pass one in, so the session is swapped after __init__.
+    """
+    original_init = KiteConnect.__init__
+    
+    @functools.wraps(original_init)
+    def __init__(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        self.reqsession = _KITE_HTTP
+    
+    KiteConnect.__init__ = __init__
+
+_patch_kite_client()
+
 class AuthenticationError(Exception):
     """Custom exception for authentication failures"""
     pass
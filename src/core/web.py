@@ -0,0 +1,52 @@
+"""
+Mosaic Vault - Web Helpers
+JSON encoding and response compression shared by the Flask dashboards.
+"""
+
+import logging
+from enum import Enum
+
+import orjson
+from flask import Flask, Response
+from flask.json.provider import JSONProvider
+
+logger = logging.getLogger(__name__)
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def orjson_default(obj):
+    """Serialize types orjson does not handle natively"""
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson (datetimes are emitted as ISO 8601).
+    Output is always compact and in insertion order: no OPT_INDENT_2, no OPT_SORT_KEYS.
+    """
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=orjson_default, option=ORJSON_OPTIONS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=orjson_default, option=ORJSON_OPTIONS),
+            mimetype='application/json'
+        )
+
+def setup_compression(app: Flask) -> None:
+    """Brotli/gzip-compress HTML and JSON responses when flask-compress is installed"""
+    try:
+        from flask_compress import Compress
+    except ImportError:
+        logger.info("flask-compress not installed - responses are sent uncompressed")
+        return
+    
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app)
@@ -3,20 +3,31 @@ Mosaic Vault - Simple Web Dashboard
 Flask-based web interface for portfolio monitoring.
 """
 
-from flask import Flask, render_template, jsonify, request, make_response
+from flask import Flask, Response, render_template, jsonify, request, make_response
+import base64
+import functools
+import hashlib
 import threading
 import time
-import json
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
 import os
-import sys
+import re
 import logging
+import math
+import mmap
+from string import Template
 from typing import Dict, List, Optional
 
-# Add src to path for imports
-sys.path.append(os.path.dirname(__file__))
+import orjson
+from cachetools import TTLCache
+from kiteconnect import KiteConnect
+from markupsafe import escape
+from werkzeug.http import dump_cookie, http_date
 
 from core.auth import get_kite_session
+from core.web import ORJSON_OPTIONS, OrjsonProvider, orjson_default, setup_compression
 from agents.governor import Governor
 from agents.scout import Scout
 from config import get_config
@@ -24,6 +35,768 @@ from config import get_config
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Main dashboard page (minified once at import, see _minify_html)
+_DASHBOARD_HTML = '''
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Mosaic Vault - Dashboard</title>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <style>
+        body { 
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
+            margin: 0; 
+            padding: 20px; 
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+        }
+        .container { 
+            max-width: 1200px; 
+            margin: 0 auto; 
+            background: white; 
+            border-radius: 10px; 
+            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+            overflow: hidden;
+        }
+        .header { 
+            background: linear-gradient(45deg, #2c3e50, #34495e); 
+            color: white; 
+            padding: 20px; 
+            text-align: center; 
+        }
+        .header h1 { margin: 0; font-size: 2.5em; }
+        .header p { margin: 10px 0 0 0; opacity: 0.8; }
+        .dashboard { 
+            display: grid; 
+            grid-template-columns: 1fr 1fr; 
+            gap: 20px; 
+            padding: 20px; 
+        }
+        .panel { 
+            background: #f8f9fa; 
+            border-radius: 8px; 
+            padding: 20px; 
+            border-left: 4px solid #3498db;
+        }
+        .panel h3 { margin-top: 0; color: #2c3e50; }
+        .risk-zone { 
+            display: inline-block; 
+            padding: 8px 16px; 
+            border-radius: 20px; 
+            font-weight: bold; 
+            text-transform: uppercase;
+        }
+        .risk-green { background: #2ecc71; color: white; }
+        .risk-yellow { background: #f39c12; color: white; }
+        .risk-red { background: #e74c3c; color: white; }
+        .metric { 
+            display: flex; 
+            justify-content: space-between; 
+            margin: 10px 0; 
+            padding: 10px; 
+            background: white; 
+            border-radius: 4px;
+        }
+        .metric-value { font-weight: bold; }
+        .holdings-table { 
+            width: 100%; 
+            border-collapse: collapse; 
+            margin-top: 15px;
+        }
+        .holdings-table th, .holdings-table td { 
+            padding: 12px; 
+            text-align: left; 
+            border-bottom: 1px solid #ddd; 
+        }
+        .holdings-table th { 
+            background: #34495e; 
+            color: white; 
+        }
+        .positive { color: #27ae60; }
+        .negative { color: #e74c3c; }
+        .refresh-btn { 
+            background: #3498db; 
+            color: white; 
+            border: none; 
+            padding: 10px 20px; 
+            border-radius: 4px; 
+            cursor: pointer; 
+            margin: 10px 5px;
+        }
+        .refresh-btn:hover { background: #2980b9; }
+        .analysis-section { 
+            grid-column: 1 / -1; 
+            margin-top: 20px; 
+        }
+        .analysis-input { 
+            padding: 10px; 
+            border: 1px solid #ddd; 
+            border-radius: 4px; 
+            margin: 5px;
+        }
+        .footer { 
+            text-align: center; 
+            padding: 20px; 
+            background: #f8f9fa; 
+            color: #666; 
+            border-top: 1px solid #ddd;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🏛️ MOSAIC VAULT</h1>
+            <p id="header-subtitle">Autonomous Family Office System</p>
+            <div id="user-profile" style="margin-top: 10px; font-size: 0.9em; opacity: 0.8;"></div>
+        </div>
+        
+        <div class="dashboard">
+            <div class="panel">
+                <h3>📊 Portfolio Status</h3>
+                <div id="portfolio-status">Loading...</div>
+            </div>
+            
+            <div class="panel">
+                <h3>🛡️ Risk Management</h3>
+                <div id="risk-status">Loading...</div>
+            </div>
+            
+            <div class="panel">
+                <h3>💼 Holdings</h3>
+                <div id="holdings-data">Loading...</div>
+            </div>
+            
+            <div class="panel">
+                <h3>🔍 Analysis</h3>
+                <input type="text" id="symbol-input" class="analysis-input" placeholder="Enter symbol (e.g., RELIANCE)" />
+                <button class="refresh-btn" onclick="analyzeStock()">Analyze</button>
+                <div id="analysis-result"></div>
+            </div>
+            
+            <div class="panel" id="auth-panel">
+                <h3>🔐 Authentication</h3>
+                <div id="auth-status">Checking...</div>
+                <div id="auth-details" style="margin-top: 10px; font-size: 0.9em; color: #666;"></div>
+                <button class="refresh-btn" id="login-btn" onclick="authenticateKite()" style="display:none;">🔑 Connect to Kite</button>
+                <button class="refresh-btn" id="logout-btn" onclick="clearAuthCookies()" style="display:none; background: #e74c3c;">🚪 Logout</button>
+            </div>
+        </div>
+        
+        <div class="footer">
+            <p>Last updated: <span id="last-update">Never</span></p>
+            <button class="refresh-btn" onclick="refreshData()">🔄 Refresh All</button>
+        </div>
+    </div>
+    
+    <script>
+        function updatePortfolioStatus(data) {
+            const statusDiv = document.getElementById('portfolio-status');
+            const riskClass = data.status.toLowerCase() === 'green' ? 'risk-green' : 
+                             data.status.toLowerCase() === 'yellow' ? 'risk-yellow' : 'risk-red';
+            
+            statusDiv.innerHTML = `
+                <div class="metric">
+                    <span>Portfolio Value:</span>
+                    <span class="metric-value">₹${data.total_value.toLocaleString('en-IN')}</span>
+                </div>
+                <div class="metric">
+                    <span>Risk Zone:</span>
+                    <span class="risk-zone ${riskClass}">${data.status}</span>
+                </div>
+                <div class="metric">
+                    <span>Drawdown:</span>
+                    <span class="metric-value ${data.drawdown_pct > 5 ? 'negative' : 'positive'}">${data.drawdown_pct.toFixed(1)}%</span>
+                </div>
+                <div class="metric">
+                    <span>Action:</span>
+                    <span class="metric-value">${data.action}</span>
+                </div>
+            `;
+        }
+        
+        function updateRiskStatus(data) {
+            const riskDiv = document.getElementById('risk-status');
+            riskDiv.innerHTML = `
+                <div class="metric">
+                    <span>Floor Value:</span>
+                    <span class="metric-value">₹${data.floor_value.toLocaleString('en-IN')}</span>
+                </div>
+                <div class="metric">
+                    <span>Cushion:</span>
+                    <span class="metric-value">₹${data.cushion.toLocaleString('en-IN')}</span>
+                </div>
+                <div class="metric">
+                    <span>Equity Target:</span>
+                    <span class="metric-value">${data.equity_allocation_target.toFixed(0)}%</span>
+                </div>
+            `;
+        }
+        
+        function updateHoldings(holdings, rowsHTML) {
+            const holdingsDiv = document.getElementById('holdings-data');
+            let tableHTML = `
+                <table class="holdings-table">
+                    <thead>
+                        <tr><th>Symbol</th><th>Qty</th><th>Price</th><th>Value</th><th>Day %</th><th>P&L %</th></tr>
+                    </thead>
+                    <tbody>
+            `;
+            
+            // Large portfolios ship their rows pre-rendered by the server
+            if (rowsHTML) {
+                holdingsDiv.innerHTML = tableHTML + rowsHTML + '</tbody></table>';
+                return;
+            }
+            
+            holdings.forEach(holding => {
+                const dayChangeClass = holding.day_change_pct >= 0 ? 'positive' : 'negative';
+                const pnlClass = holding.unrealized_pnl_pct >= 0 ? 'positive' : 'negative';
+                
+                tableHTML += `
+                    <tr>
+                        <td>${holding.symbol}</td>
+                        <td>${holding.quantity}</td>
+                        <td>₹${holding.current_price.toFixed(0)}</td>
+                        <td>₹${holding.value.toLocaleString('en-IN')}</td>
+                        <td class="${dayChangeClass}">${holding.day_change_pct > 0 ? '+' : ''}${holding.day_change_pct.toFixed(1)}%</td>
+                        <td class="${pnlClass}">${holding.unrealized_pnl_pct > 0 ? '+' : ''}${holding.unrealized_pnl_pct.toFixed(1)}%</td>
+                    </tr>
+                `;
+            });
+            
+            tableHTML += '</tbody></table>';
+            holdingsDiv.innerHTML = tableHTML;
+        }
+        
+        function refreshData() {
+            fetch('/api/portfolio')
+                .then(response => response.json())
+                .then(data => {
+                    updatePortfolioStatus(data);
+                    updateRiskStatus(data);
+                    updateHoldings(data.holdings, data.holdings_html);
+                    document.getElementById('last-update').textContent = new Date().toLocaleTimeString();
+                })
+                .catch(error => {
+                    console.error('Error fetching data:', error);
+                });
+            
+            // Update auth status and profile
+            updateAuthStatus();
+            updateUserProfile();
+        }
+        
+        function updateUserProfile() {
+            fetch('/api/profile')
+                .then(response => response.json())
+                .then(data => {
+                    const profileDiv = document.getElementById('user-profile');
+                    
+                    if (data.authenticated && data.user_name) {
+                        profileDiv.innerHTML = `👤 Welcome, ${data.user_name} (${data.user_id})`;
+                        
+                        // Update header subtitle if authenticated with real data
+                        const subtitleDiv = document.getElementById('header-subtitle');
+                        if (!data.cached) {
+                            subtitleDiv.textContent = 'Autonomous Family Office System - Live Portfolio';
+                        } else {
+                            subtitleDiv.textContent = 'Autonomous Family Office System - Cached Session';
+                        }
+                    } else {
+                        profileDiv.innerHTML = '';
+                        document.getElementById('header-subtitle').textContent = 'Autonomous Family Office System';
+                    }
+                })
+                .catch(error => {
+                    console.error('Error fetching profile:', error);
+                    document.getElementById('user-profile').innerHTML = '';
+                });
+        }
+        
+        function updateAuthStatus() {
+            // First check cookies
+            fetch('/api/auth/check-cookies')
+                .then(response => response.json())
+                .then(cookieData => {
+                    const authDiv = document.getElementById('auth-status');
+                    const authDetailsDiv = document.getElementById('auth-details');
+                    const loginBtn = document.getElementById('login-btn');
+                    const logoutBtn = document.getElementById('logout-btn');
+                    
+                    if (cookieData.authenticated) {
+                        authDiv.innerHTML = '<span style="color: green;">✅ Authenticated via Cookies</span>';
+                        
+                        // Try to get user info from cookie
+                        let userInfo = '';
+                        try {
+                            const userInfoCookie = getCookie('kite_user_info');
+                            if (userInfoCookie) {
+                                const userDetails = decodeUserInfo(userInfoCookie);
+                                userInfo = `<strong>User:</strong> ${userDetails.user_name} (${userDetails.user_id})<br>`;
+                            } else if (cookieData.user_name) {
+                                userInfo = `<strong>User:</strong> ${cookieData.user_name} (${cookieData.user_id})<br>`;
+                            }
+                        } catch (e) {
+                            if (cookieData.user_name) {
+                                userInfo = `<strong>User:</strong> ${cookieData.user_name} (${cookieData.user_id})<br>`;
+                            }
+                        }
+                        
+                        authDetailsDiv.innerHTML = userInfo + `<small>Expires in ${cookieData.days_remaining} days</small>`;
+                        loginBtn.style.display = 'none';
+                        logoutBtn.style.display = 'inline-block';
+                        return;
+                    }
+                    
+                    // If no valid cookies, check server status
+                    return fetch('/api/status');
+                })
+                .then(response => {
+                    if (!response) return; // Already handled cookie auth above
+                    return response.json();
+                })
+                .then(data => {
+                    if (!data) return; // Already handled cookie auth above
+                    
+                    const authDiv = document.getElementById('auth-status');
+                    const authDetailsDiv = document.getElementById('auth-details');
+                    const loginBtn = document.getElementById('login-btn');
+                    const logoutBtn = document.getElementById('logout-btn');
+                    
+                    if (data.mock_mode) {
+                        authDiv.innerHTML = '<span style="color: orange;">📋 Mock Mode Active</span>';
+                        authDetailsDiv.innerHTML = '<small>Using sample data for demonstration</small>';
+                        loginBtn.style.display = 'inline-block';
+                        logoutBtn.style.display = 'none';
+                    } else {
+                        authDiv.innerHTML = '<span style="color: green;">✅ Connected to Kite</span>';
+                        authDetailsDiv.innerHTML = '<small>Using real portfolio data</small>';
+                        loginBtn.style.display = 'none';
+                        logoutBtn.style.display = 'inline-block';
+                    }
+                })
+                .catch(error => {
+                    console.error('Error checking auth status:', error);
+                    const authDiv = document.getElementById('auth-status');
+                    const loginBtn = document.getElementById('login-btn');
+                    const logoutBtn = document.getElementById('logout-btn');
+                    
+                    authDiv.innerHTML = '<span style="color: red;">❌ Auth Check Failed</span>';
+                    loginBtn.style.display = 'inline-block';
+                    logoutBtn.style.display = 'none';
+                });
+        }
+        
+        // Helper function to get cookie value
+        function getCookie(name) {
+            const value = `; ${document.cookie}`;
+            const parts = value.split(`; ${name}=`);
+            if (parts.length === 2) return parts.pop().split(';').shift();
+            return null;
+        }
+        
+        // kite_user_info holds base64url-encoded JSON
+        function decodeUserInfo(value) {
+            const bytes = Uint8Array.from(atob(value.replace(/-/g, '+').replace(/_/g, '/')), c => c.charCodeAt(0));
+            return JSON.parse(new TextDecoder().decode(bytes));
+        }
+        
+        function clearAuthCookies() {
+            // Call logout API
+            fetch('/api/auth/logout', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                }
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    // Clear client-side cookies as well (belt and suspenders)
+                    document.cookie = 'kite_request_token=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
+                    document.cookie = 'kite_access_token=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
+                    document.cookie = 'kite_auth_timestamp=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
+                    document.cookie = 'kite_user_info=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
+                    
+                    // Show logout success message
+                    const authDiv = document.getElementById('auth-status');
+                    authDiv.innerHTML = '<span style="color: green;">✅ Logged out successfully</span>';
+                    
+                    // Refresh the page after a brief delay
+                    setTimeout(() => {
+                        location.reload();
+                    }, 1000);
+                } else {
+                    console.error('Logout failed:', data.message);
+                    alert('Logout failed: ' + data.message);
+                }
+            })
+            .catch(error => {
+                console.error('Logout error:', error);
+                // Fallback: clear cookies manually and refresh
+                document.cookie = 'kite_request_token=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
+                document.cookie = 'kite_access_token=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
+                document.cookie = 'kite_auth_timestamp=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
+                document.cookie = 'kite_user_info=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
+                location.reload();
+            });
+        }
+        
+        function authenticateKite() {
+            fetch('/api/auth/login-url')
+                .then(response => response.json())
+                .then(data => {
+                    if (data.login_url) {
+                        const authWindow = window.open(data.login_url, '_blank', 'width=600,height=700');
+                        
+                        // Check if auth window is closed (successful auth)
+                        const checkClosed = setInterval(() => {
+                            if (authWindow.closed) {
+                                clearInterval(checkClosed);
+                                setTimeout(() => {
+                                    // Refresh all data including profile
+                                    refreshData();
+                                    updateUserProfile();
+                                }, 2000);
+                            }
+                        }, 1000);
+                    } else {
+                        alert('Error: ' + (data.error || 'Unable to generate login URL'));
+                    }
+                })
+                .catch(error => {
+                    console.error('Error:', error);
+                    alert('Authentication failed');
+                });
+        }
+        
+        function analyzeStock() {
+            const symbol = document.getElementById('symbol-input').value.toUpperCase();
+            const resultDiv = document.getElementById('analysis-result');
+            
+            if (!symbol) {
+                resultDiv.innerHTML = '<p style="color: red;">Please enter a symbol</p>';
+                return;
+            }
+            
+            resultDiv.innerHTML = '<p>Analyzing...</p>';
+            
+            fetch(`/api/analyze/${symbol}`)
+                .then(response => response.json())
+                .then(data => {
+                    const verdictColor = data.verdict === 'THESIS_INTACT' ? 'positive' : 
+                                       data.verdict === 'CYCLICAL_PAIN' ? '#f39c12' : 'negative';
+                    
+                    resultDiv.innerHTML = `
+                        <div style="margin-top: 15px; padding: 10px; background: white; border-radius: 4px;">
+                            <h4>${symbol} Analysis</h4>
+                            <p><strong>Verdict:</strong> <span style="color: ${verdictColor};">${data.verdict}</span></p>
+                            <p><strong>Confidence:</strong> ${(data.confidence * 100).toFixed(0)}%</p>
+                            <p><strong>Reasoning:</strong> ${data.reasoning}</p>
+                        </div>
+                    `;
+                })
+                .catch(error => {
+                    resultDiv.innerHTML = '<p style="color: red;">Analysis failed</p>';
+                    console.error('Error:', error);
+                });
+        }
+        
+        // Auto-refresh every 30 seconds
+        setInterval(refreshData, 30000);
+        
+        // Initial load
+        refreshData();
+        updateUserProfile();
+    </script>
+</body>
+</html>
+'''
+
+_STYLE_RE = re.compile(r'(<style>)(.*?)(</style>)', re.DOTALL)
+_SCRIPT_RE = re.compile(r'(<script>)(.*?)(</script>)', re.DOTALL)
+
+def _minify_html(html: str) -> str:
+    """Minify inline <style>/<script> blocks; returns html unchanged if minifiers are missing"""
+    try:
+        import rcssmin
+        import rjsmin
+    except ImportError:
+        logger.debug("rcssmin/rjsmin not installed - serving unminified dashboard")
+        return html
+    
+    html = _STYLE_RE.sub(lambda m: m.group(1) + rcssmin.cssmin(m.group(2)) + m.group(3), html)
+    html = _SCRIPT_RE.sub(lambda m: m.group(1) + rjsmin.jsmin(m.group(2)) + m.group(3), html)
+    return html
+
+_INDEX_HTML = _minify_html(_DASHBOARD_HTML)
+
+# Auth callback pages, parsed once; substituted values are HTML-escaped by the caller
+_AUTH_TOKEN_FAILED_TPL = Template('''
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Authentication Failed</title>
+    <style>
+        body { 
+            font-family: Arial, sans-serif; 
+            padding: 40px; 
+            text-align: center; 
+            background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
+            color: white;
+            min-height: 100vh;
+            margin: 0;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }
+        .container {
+            background: rgba(255,255,255,0.1);
+            padding: 30px;
+            border-radius: 10px;
+            backdrop-filter: blur(10px);
+            box-shadow: 0 10px 30px rgba(0,0,0,0.3);
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>❌ Authentication Failed</h1>
+        <p>Failed to generate access token.</p>
+        <p>Error: $token_error</p>
+        <button onclick="window.close()" style="padding: 10px 20px; background: white; color: #c0392b; border: none; border-radius: 5px; cursor: pointer;">Close Window</button>
+    </div>
+</body>
+</html>
+''')
+
+_AUTH_SUCCESS_TPL = Template('''
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Authentication Success</title>
+    <style>
+        body { 
+            font-family: Arial, sans-serif; 
+            padding: 40px; 
+            text-align: center; 
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            min-height: 100vh;
+            margin: 0;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }
+        .container {
+            background: rgba(255,255,255,0.1);
+            padding: 30px;
+            border-radius: 10px;
+            backdrop-filter: blur(10px);
+            box-shadow: 0 10px 30px rgba(0,0,0,0.3);
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🎉 Authentication Successful!</h1>
+        <p>Welcome, $user_name!</p>
+        <p><strong>User ID:</strong> $user_id</p>
+        <p>🔐 Authentication tokens securely stored in cookies.</p>
+        <p>The dashboard will now use your real holdings.</p>
+        <p><small>This window will close automatically in 3 seconds...</small></p>
+        <script>
+            setTimeout(() => {
+                window.close();
+                // If window doesn't close (some browsers), redirect to dashboard
+                if (!window.closed) {
+                    window.location.href = '/';
+                }
+            }, 3000);
+        </script>
+    </div>
+</body>
+</html>
+''')
+
+_AUTH_FAILED_HTML = '''
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Authentication Failed</title>
+    <style>
+        body { 
+            font-family: Arial, sans-serif; 
+            padding: 40px; 
+            text-align: center; 
+            background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
+            color: white;
+            min-height: 100vh;
+            margin: 0;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }
+        .container {
+            background: rgba(255,255,255,0.1);
+            padding: 30px;
+            border-radius: 10px;
+            backdrop-filter: blur(10px);
+            box-shadow: 0 10px 30px rgba(0,0,0,0.3);
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>❌ Authentication Failed</h1>
+        <p>There was an error with the authentication process.</p>
+        <p>Please try again or check your credentials.</p>
+        <button onclick="window.close()" style="padding: 10px 20px; background: white; color: #c0392b; border: none; border-radius: 5px; cursor: pointer;">Close Window</button>
+    </div>
+</body>
+</html>
+'''
+
+_USER_INFO_FIELDS = ('user_name', 'user_id', 'email')
+
+@dataclass
+class UserInfo:
+    """User details cached in the kite_user_info cookie"""
+    user_name: str = 'Unknown'
+    user_id: str = 'Unknown'
+    email: str = 'Unknown'
+    
+    def to_cookie(self) -> str:
+        """Compact JSON, base64url-encoded so the value never needs cookie quoting"""
+        return base64.urlsafe_b64encode(orjson.dumps(asdict(self))).decode('ascii')
+    
+    @classmethod
+    def from_cookie(cls, cookie: str) -> 'UserInfo':
+        """Decode the cookie, ignoring unknown keys (raises ValueError if malformed)"""
+        # Cookies set before the base64 encoding hold the JSON object directly
+        raw = cookie if cookie.startswith('{') else base64.urlsafe_b64decode(cookie)
+        data = orjson.loads(raw)
+        if not isinstance(data, dict):
+            raise ValueError("kite_user_info is not a JSON object")
+        return cls(**{name: str(data[name]) for name in _USER_INFO_FIELDS if name in data})
+
+# Auth cookies live for 30 days
+_COOKIE_MAX_AGE = 30 * 24 * 60 * 60
+
+# Cookie values that can be sent without RFC 6265 quoting
+_COOKIE_SAFE_RE = re.compile(r"[\w!#$%&'()*+\-./:<=>?@\[\]^`{|}~]*", re.ASCII)
+
+def _cookie_header(name: str, value: str, expires: str, httponly: bool) -> str:
+    """
+    Set-Cookie header value with the dashboard's fixed attributes (Path=/, SameSite=Lax).
+    Not marked Secure: set it when serving over HTTPS in production.
+    """
+    if not _COOKIE_SAFE_RE.fullmatch(value):
+        # Values needing quoting/escaping go through werkzeug
+        return dump_cookie(name, value, expires=expires, path='/', httponly=httponly, samesite='Lax')
+    
+    header = f"{name}={value}; Expires={expires}; Path=/; SameSite=Lax"
+    return header + '; HttpOnly' if httponly else header
+
+# KITE_REQUEST_TOKEN / KITE_ACCESS_TOKEN assignments in .env (value, group 2, cleared on logout)
+_ENV_TOKEN_RE = re.compile(rb'^(KITE_(?:REQUEST|ACCESS)_TOKEN)=([^\r\n]*)', re.MULTILINE)
+
+# Portfolios with more holdings than this get their table rows rendered server-side
+_HOLDINGS_HTML_THRESHOLD = 50
+
+def _js_fixed(x: float, digits: int) -> str:
+    """Number.prototype.toFixed: exact binary value, ties away from zero, no '-0'"""
+    sign = '-' if x < 0 else ''
+    return sign + str(Decimal(abs(x)).quantize(Decimal(1).scaleb(-digits), rounding=ROUND_HALF_UP))
+
+def _js_locale_in(x: float) -> str:
+    """
+    Number.prototype.toLocaleString('en-IN'): up to 3 decimals, lakh/crore digit grouping.
+    Unlike toFixed, Intl rounds the shortest repr of the double and keeps the sign of -0.
+    """
+    sign = '-' if math.copysign(1.0, x) < 0 else ''
+    fixed = str(Decimal(repr(abs(x))).quantize(Decimal('0.001'), rounding=ROUND_HALF_UP))
+    whole, frac = fixed.split('.')
+    frac = frac.rstrip('0')
+    head, tail = whole[:-3], whole[-3:]
+    groups = [head[max(i - 2, 0):i] for i in range(len(head), 0, -2)][::-1]
+    return sign + ','.join(groups + [tail]) + ('.' + frac if frac else '')
+
+def _js_signed_pct(pct: float) -> str:
+    """The table's `${pct > 0 ? '+' : ''}${pct.toFixed(1)}%`"""
+    return ('+' if pct > 0 else '') + _js_fixed(pct, 1) + '%'
+
+def _render_holdings_rows(holdings: List[Dict]) -> str:
+    """Render holdings as <tr> rows formatted exactly like the dashboard's client-side table"""
+    rows = []
+    for h in holdings:
+        day_pct = h['day_change_pct']
+        pnl_pct = h['unrealized_pnl_pct']
+        rows.append(
+            f"<tr><td>{escape(h['symbol'])}</td><td>{h['quantity']}</td>"
+            f"<td>₹{_js_fixed(h['current_price'], 0)}</td><td>₹{_js_locale_in(h['value'])}</td>"
+            f"<td class=\"{'positive' if day_pct >= 0 else 'negative'}\">{_js_signed_pct(day_pct)}</td>"
+            f"<td class=\"{'positive' if pnl_pct >= 0 else 'negative'}\">{_js_signed_pct(pnl_pct)}</td></tr>"
+        )
+    return ''.join(rows)
+
+def _add_holdings_html(portfolio_data: Dict) -> Dict:
+    """Attach pre-rendered table rows to large portfolio payloads (the holdings list stays for API clients)"""
+    holdings = portfolio_data.get('holdings') or []
+    if len(holdings) > _HOLDINGS_HTML_THRESHOLD:
+        portfolio_data['holdings_html'] = _render_holdings_rows(holdings)
+    return portfolio_data
+
+# Pre-serialized bodies for the negative cookie-auth answers (hit by every bad/absent cookie)
+_AUTH_TOKEN_INVALID = orjson.dumps({
+    'authenticated': False,
+    'reason': 'Token validation failed',
+    'need_reauth': True
+})
+_AUTH_TOKENS_EXPIRED = orjson.dumps({
+    'authenticated': False,
+    'reason': 'Tokens expired',
+    'need_reauth': True
+})
+_AUTH_NO_TOKENS = orjson.dumps({
+    'authenticated': False,
+    'reason': 'No stored tokens found',
+    'need_reauth': True
+})
+
+def _plausible_token(token: str) -> bool:
+    """Cheap shape check for a Kite token (alphanumeric, 20-128 chars) before any API work"""
+    return 20 <= len(token) <= 128 and token.isalnum()
+
+def _json_bytes(body: bytes) -> Response:
+    """Wrap an already-serialized JSON body in a response"""
+    return Response(body, mimetype='application/json')
+
+def _etag_response(view=None, *, max_age: Optional[int] = None):
+    """
+    Tag successful responses with a weak ETag and answer 304 when the client already has them.
+    With max_age, also let the browser reuse the response privately for that many seconds
+    (varying on Cookie so a login/logout is never answered from cache).
+    """
+    if view is None:
+        return functools.partial(_etag_response, max_age=max_age)
+    
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        response = make_response(view(*args, **kwargs))
+        if response.status_code != 200 or response.direct_passthrough:
+            return response
+        
+        response.set_etag(hashlib.blake2b(response.get_data(), digest_size=8).hexdigest(), weak=True)
+        if max_age is not None:
+            response.cache_control.private = True
+            response.cache_control.max_age = max_age
+            response.vary.add('Cookie')
+        return response.make_conditional(request)
+    return wrapper
+
 class WebDashboard:
     """
     Simple web-based dashboard for Mosaic Vault
@@ -31,6 +804,8 @@ class WebDashboard:
     
     def __init__(self, port: int = 5000, debug: bool = False):
         self.app = Flask(__name__)
+        self.app.json = OrjsonProvider(self.app)
+        setup_compression(self.app)
         self.port = port
         self.debug = debug
         
@@ -40,504 +815,63 @@ class WebDashboard:
         self.governor = None
         self.scout = Scout()
         
+        # Per access token: reusable Kite clients and recently fetched profiles
+        self._kite_clients = TTLCache(maxsize=1024, ttl=300)
+        self._profile_cache = TTLCache(maxsize=1024, ttl=300)
+        # Short-lived serialized audit results so bursts of dashboard polls hit Kite (and orjson) once
+        self._portfolio_cache = TTLCache(maxsize=512, ttl=10)
+        self._cache_lock = threading.Lock()
+        
+        # (formatted_at, value) for the auth cookies' Expires attribute
+        self._cookie_expiry_cache = (0.0, '')
+        
         # Setup routes
         self._setup_routes()
         self._initialize_system()
+        
+        # The login URL only depends on the API key, so serialize it once
+        self._login_url_body = self._build_login_url_body()
     
     def _setup_routes(self):
         """Setup Flask routes"""
+        # Dependencies that are fixed by now, bound once for the view closures below
+        # (governor and the login-URL body are created later and stay attribute lookups)
+        config = self.config
+        scout = self.scout
+        cached_profile = self._cached_profile
+        fetch_profile = self._fetch_profile
+        portfolio_payload = self._portfolio_payload
         
         @self.app.route('/')
         def index():
             """Main dashboard page"""
-            return '''
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Mosaic Vault - Dashboard</title>
-                <meta charset="utf-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1">
-                <style>
-                    body { 
-                        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-                        margin: 0; 
-                        padding: 20px; 
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        min-height: 100vh;
-                    }
-                    .container { 
-                        max-width: 1200px; 
-                        margin: 0 auto; 
-                        background: white; 
-                        border-radius: 10px; 
-                        box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-                        overflow: hidden;
-                    }
-                    .header { 
-                        background: linear-gradient(45deg, #2c3e50, #34495e); 
-                        color: white; 
-                        padding: 20px; 
-                        text-align: center; 
-                    }
-                    .header h1 { margin: 0; font-size: 2.5em; }
-                    .header p { margin: 10px 0 0 0; opacity: 0.8; }
-                    .dashboard { 
-                        display: grid; 
-                        grid-template-columns: 1fr 1fr; 
-                        gap: 20px; 
-                        padding: 20px; 
-                    }
-                    .panel { 
-                        background: #f8f9fa; 
-                        border-radius: 8px; 
-                        padding: 20px; 
-                        border-left: 4px solid #3498db;
-                    }
-                    .panel h3 { margin-top: 0; color: #2c3e50; }
-                    .risk-zone { 
-                        display: inline-block; 
-                        padding: 8px 16px; 
-                        border-radius: 20px; 
-                        font-weight: bold; 
-                        text-transform: uppercase;
-                    }
-                    .risk-green { background: #2ecc71; color: white; }
-                    .risk-yellow { background: #f39c12; color: white; }
-                    .risk-red { background: #e74c3c; color: white; }
-                    .metric { 
-                        display: flex; 
-                        justify-content: space-between; 
-                        margin: 10px 0; 
-                        padding: 10px; 
-                        background: white; 
-                        border-radius: 4px;
-                    }
-                    .metric-value { font-weight: bold; }
-                    .holdings-table { 
-                        width: 100%; 
-                        border-collapse: collapse; 
-                        margin-top: 15px;
-                    }
-                    .holdings-table th, .holdings-table td { 
-                        padding: 12px; 
-                        text-align: left; 
-                        border-bottom: 1px solid #ddd; 
-                    }
-                    .holdings-table th { 
-                        background: #34495e; 
-                        color: white; 
-                    }
-                    .positive { color: #27ae60; }
-                    .negative { color: #e74c3c; }
-                    .refresh-btn { 
-                        background: #3498db; 
-                        color: white; 
-                        border: none; 
-                        padding: 10px 20px; 
-                        border-radius: 4px; 
-                        cursor: pointer; 
-                        margin: 10px 5px;
-                    }
-                    .refresh-btn:hover { background: #2980b9; }
-                    .analysis-section { 
-                        grid-column: 1 / -1; 
-                        margin-top: 20px; 
-                    }
-                    .analysis-input { 
-                        padding: 10px; 
-                        border: 1px solid #ddd; 
-                        border-radius: 4px; 
-                        margin: 5px;
-                    }
-                    .footer { 
-                        text-align: center; 
-                        padding: 20px; 
-                        background: #f8f9fa; 
-                        color: #666; 
-                        border-top: 1px solid #ddd;
-                    }
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="header">
-                        <h1>🏛️ MOSAIC VAULT</h1>
-                        <p id="header-subtitle">Autonomous Family Office System</p>
-                        <div id="user-profile" style="margin-top: 10px; font-size: 0.9em; opacity: 0.8;"></div>
-                    </div>
-                    
-                    <div class="dashboard">
-                        <div class="panel">
-                            <h3>📊 Portfolio Status</h3>
-                            <div id="portfolio-status">Loading...</div>
-                        </div>
-                        
-                        <div class="panel">
-                            <h3>🛡️ Risk Management</h3>
-                            <div id="risk-status">Loading...</div>
-                        </div>
-                        
-                        <div class="panel">
-                            <h3>💼 Holdings</h3>
-                            <div id="holdings-data">Loading...</div>
-                        </div>
-                        
-                        <div class="panel">
-                            <h3>🔍 Analysis</h3>
-                            <input type="text" id="symbol-input" class="analysis-input" placeholder="Enter symbol (e.g., RELIANCE)" />
-                            <button class="refresh-btn" onclick="analyzeStock()">Analyze</button>
-                            <div id="analysis-result"></div>
-                        </div>
-                        
-                        <div class="panel" id="auth-panel">
-                            <h3>🔐 Authentication</h3>
-                            <div id="auth-status">Checking...</div>
-                            <div id="auth-details" style="margin-top: 10px; font-size: 0.9em; color: #666;"></div>
-                            <button class="refresh-btn" id="login-btn" onclick="authenticateKite()" style="display:none;">🔑 Connect to Kite</button>
-                            <button class="refresh-btn" id="logout-btn" onclick="clearAuthCookies()" style="display:none; background: #e74c3c;">🚪 Logout</button>
-                        </div>
-                    </div>
-                    
-                    <div class="footer">
-                        <p>Last updated: <span id="last-update">Never</span></p>
-                        <button class="refresh-btn" onclick="refreshData()">🔄 Refresh All</button>
-                    </div>
-                </div>
-                
-                <script>
-                    function updatePortfolioStatus(data) {
-                        const statusDiv = document.getElementById('portfolio-status');
-                        const riskClass = data.status.toLowerCase() === 'green' ? 'risk-green' : 
-                                         data.status.toLowerCase() === 'yellow' ? 'risk-yellow' : 'risk-red';
-                        
-                        statusDiv.innerHTML = `
-                            <div class="metric">
-                                <span>Portfolio Value:</span>
-                                <span class="metric-value">₹${data.total_value.toLocaleString()}</span>
-                            </div>
-                            <div class="metric">
-                                <span>Risk Zone:</span>
-                                <span class="risk-zone ${riskClass}">${data.status}</span>
-                            </div>
-                            <div class="metric">
-                                <span>Drawdown:</span>
-                                <span class="metric-value ${data.drawdown_pct > 5 ? 'negative' : 'positive'}">${data.drawdown_pct.toFixed(1)}%</span>
-                            </div>
-                            <div class="metric">
-                                <span>Action:</span>
-                                <span class="metric-value">${data.action}</span>
-                            </div>
-                        `;
-                    }
-                    
-                    function updateRiskStatus(data) {
-                        const riskDiv = document.getElementById('risk-status');
-                        riskDiv.innerHTML = `
-                            <div class="metric">
-                                <span>Floor Value:</span>
-                                <span class="metric-value">₹${data.floor_value.toLocaleString()}</span>
-                            </div>
-                            <div class="metric">
-                                <span>Cushion:</span>
-                                <span class="metric-value">₹${data.cushion.toLocaleString()}</span>
-                            </div>
-                            <div class="metric">
-                                <span>Equity Target:</span>
-                                <span class="metric-value">${data.equity_allocation_target.toFixed(0)}%</span>
-                            </div>
-                        `;
-                    }
-                    
-                    function updateHoldings(holdings) {
-                        const holdingsDiv = document.getElementById('holdings-data');
-                        let tableHTML = `
-                            <table class="holdings-table">
-                                <thead>
-                                    <tr><th>Symbol</th><th>Qty</th><th>Price</th><th>Value</th><th>Day %</th><th>P&L %</th></tr>
-                                </thead>
-                                <tbody>
-                        `;
-                        
-                        holdings.forEach(holding => {
-                            const dayChangeClass = holding.day_change_pct >= 0 ? 'positive' : 'negative';
-                            const pnlClass = holding.unrealized_pnl_pct >= 0 ? 'positive' : 'negative';
-                            
-                            tableHTML += `
-                                <tr>
-                                    <td>${holding.symbol}</td>
-                                    <td>${holding.quantity}</td>
-                                    <td>₹${holding.current_price.toFixed(0)}</td>
-                                    <td>₹${holding.value.toLocaleString()}</td>
-                                    <td class="${dayChangeClass}">${holding.day_change_pct > 0 ? '+' : ''}${holding.day_change_pct.toFixed(1)}%</td>
-                                    <td class="${pnlClass}">${holding.unrealized_pnl_pct > 0 ? '+' : ''}${holding.unrealized_pnl_pct.toFixed(1)}%</td>
-                                </tr>
-                            `;
-                        });
-                        
-                        tableHTML += '</tbody></table>';
-                        holdingsDiv.innerHTML = tableHTML;
-                    }
-                    
-                    function refreshData() {
-                        fetch('/api/portfolio')
-                            .then(response => response.json())
-                            .then(data => {
-                                updatePortfolioStatus(data);
-                                updateRiskStatus(data);
-                                updateHoldings(data.holdings);
-                                document.getElementById('last-update').textContent = new Date().toLocaleTimeString();
-                            })
-                            .catch(error => {
-                                console.error('Error fetching data:', error);
-                            });
-                        
-                        // Update auth status and profile
-                        updateAuthStatus();
-                        updateUserProfile();
-                    }
-                    
-                    function updateUserProfile() {
-                        fetch('/api/profile')
-                            .then(response => response.json())
-                            .then(data => {
-                                const profileDiv = document.getElementById('user-profile');
-                                
-                                if (data.authenticated && data.user_name) {
-                                    profileDiv.innerHTML = `👤 Welcome, ${data.user_name} (${data.user_id})`;
-                                    
-                                    // Update header subtitle if authenticated with real data
-                                    const subtitleDiv = document.getElementById('header-subtitle');
-                                    if (!data.cached) {
-                                        subtitleDiv.textContent = 'Autonomous Family Office System - Live Portfolio';
-                                    } else {
-                                        subtitleDiv.textContent = 'Autonomous Family Office System - Cached Session';
-                                    }
-                                } else {
-                                    profileDiv.innerHTML = '';
-                                    document.getElementById('header-subtitle').textContent = 'Autonomous Family Office System';
-                                }
-                            })
-                            .catch(error => {
-                                console.error('Error fetching profile:', error);
-                                document.getElementById('user-profile').innerHTML = '';
-                            });
-                    }
-                    
-                    function updateAuthStatus() {
-                        // First check cookies
-                        fetch('/api/auth/check-cookies')
-                            .then(response => response.json())
-                            .then(cookieData => {
-                                const authDiv = document.getElementById('auth-status');
-                                const authDetailsDiv = document.getElementById('auth-details');
-                                const loginBtn = document.getElementById('login-btn');
-                                const logoutBtn = document.getElementById('logout-btn');
-                                
-                                if (cookieData.authenticated) {
-                                    authDiv.innerHTML = '<span style="color: green;">✅ Authenticated via Cookies</span>';
-                                    
-                                    // Try to get user info from cookie
-                                    let userInfo = '';
-                                    try {
-                                        const userInfoCookie = getCookie('kite_user_info');
-                                        if (userInfoCookie) {
-                                            const userDetails = JSON.parse(userInfoCookie);
-                                            userInfo = `<strong>User:</strong> ${userDetails.user_name} (${userDetails.user_id})<br>`;
-                                        } else if (cookieData.user_name) {
-                                            userInfo = `<strong>User:</strong> ${cookieData.user_name} (${cookieData.user_id})<br>`;
-                                        }
-                                    } catch (e) {
-                                        if (cookieData.user_name) {
-                                            userInfo = `<strong>User:</strong> ${cookieData.user_name} (${cookieData.user_id})<br>`;
-                                        }
-                                    }
-                                    
-                                    authDetailsDiv.innerHTML = userInfo + `<small>Expires in ${cookieData.days_remaining} days</small>`;
-                                    loginBtn.style.display = 'none';
-                                    logoutBtn.style.display = 'inline-block';
-                                    return;
-                                }
-                                
-                                // If no valid cookies, check server status
-                                return fetch('/api/status');
-                            })
-                            .then(response => {
-                                if (!response) return; // Already handled cookie auth above
-                                return response.json();
-                            })
-                            .then(data => {
-                                if (!data) return; // Already handled cookie auth above
-                                
-                                const authDiv = document.getElementById('auth-status');
-                                const authDetailsDiv = document.getElementById('auth-details');
-                                const loginBtn = document.getElementById('login-btn');
-                                const logoutBtn = document.getElementById('logout-btn');
-                                
-                                if (data.mock_mode) {
-                                    authDiv.innerHTML = '<span style="color: orange;">📋 Mock Mode Active</span>';
-                                    authDetailsDiv.innerHTML = '<small>Using sample data for demonstration</small>';
-                                    loginBtn.style.display = 'inline-block';
-                                    logoutBtn.style.display = 'none';
-                                } else {
-                                    authDiv.innerHTML = '<span style="color: green;">✅ Connected to Kite</span>';
-                                    authDetailsDiv.innerHTML = '<small>Using real portfolio data</small>';
-                                    loginBtn.style.display = 'none';
-                                    logoutBtn.style.display = 'inline-block';
-                                }
-                            })
-                            .catch(error => {
-                                console.error('Error checking auth status:', error);
-                                const authDiv = document.getElementById('auth-status');
-                                const loginBtn = document.getElementById('login-btn');
-                                const logoutBtn = document.getElementById('logout-btn');
-                                
-                                authDiv.innerHTML = '<span style="color: red;">❌ Auth Check Failed</span>';
-                                loginBtn.style.display = 'inline-block';
-                                logoutBtn.style.display = 'none';
-                            });
-                    }
-                    
-                    // Helper function to get cookie value
-                    function getCookie(name) {
-                        const value = `; ${document.cookie}`;
-                        const parts = value.split(`; ${name}=`);
-                        if (parts.length === 2) return parts.pop().split(';').shift();
-                        return null;
-                    }
-                    
-                    function clearAuthCookies() {
-                        // Call logout API
-                        fetch('/api/auth/logout', {
-                            method: 'POST',
-                            headers: {
-                                'Content-Type': 'application/json'
-                            }
-                        })
-                        .then(response => response.json())
-                        .then(data => {
-                            if (data.success) {
-                                // Clear client-side cookies as well (belt and suspenders)
-                                document.cookie = 'kite_request_token=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
-                                document.cookie = 'kite_access_token=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
-                                document.cookie = 'kite_auth_timestamp=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
-                                document.cookie = 'kite_user_info=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
-                                
-                                // Show logout success message
-                                const authDiv = document.getElementById('auth-status');
-                                authDiv.innerHTML = '<span style="color: green;">✅ Logged out successfully</span>';
-                                
-                                // Refresh the page after a brief delay
-                                setTimeout(() => {
-                                    location.reload();
-                                }, 1000);
-                            } else {
-                                console.error('Logout failed:', data.message);
-                                alert('Logout failed: ' + data.message);
-                            }
-                        })
-                        .catch(error => {
-                            console.error('Logout error:', error);
-                            // Fallback: clear cookies manually and refresh
-                            document.cookie = 'kite_request_token=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
-                            document.cookie = 'kite_access_token=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
-                            document.cookie = 'kite_auth_timestamp=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
-                            document.cookie = 'kite_user_info=; expires=Thu, 01 Jan 1970 00:00:00 UTC; path=/;';
-                            location.reload();
-                        });
-                    }
-                    
-                    function authenticateKite() {
-                        fetch('/api/auth/login-url')
-                            .then(response => response.json())
-                            .then(data => {
-                                if (data.login_url) {
-                                    const authWindow = window.open(data.login_url, '_blank', 'width=600,height=700');
-                                    
-                                    // Check if auth window is closed (successful auth)
-                                    const checkClosed = setInterval(() => {
-                                        if (authWindow.closed) {
-                                            clearInterval(checkClosed);
-                                            setTimeout(() => {
-                                                // Refresh all data including profile
-                                                refreshData();
-                                                updateUserProfile();
-                                            }, 2000);
-                                        }
-                                    }, 1000);
-                                } else {
-                                    alert('Error: ' + (data.error || 'Unable to generate login URL'));
-                                }
-                            })
-                            .catch(error => {
-                                console.error('Error:', error);
-                                alert('Authentication failed');
-                            });
-                    }
-                    
-                    function analyzeStock() {
-                        const symbol = document.getElementById('symbol-input').value.toUpperCase();
-                        const resultDiv = document.getElementById('analysis-result');
-                        
-                        if (!symbol) {
-                            resultDiv.innerHTML = '<p style="color: red;">Please enter a symbol</p>';
-                            return;
-                        }
-                        
-                        resultDiv.innerHTML = '<p>Analyzing...</p>';
-                        
-                        fetch(`/api/analyze/${symbol}`)
-                            .then(response => response.json())
-                            .then(data => {
-                                const verdictColor = data.verdict === 'THESIS_INTACT' ? 'positive' : 
-                                                   data.verdict === 'CYCLICAL_PAIN' ? '#f39c12' : 'negative';
-                                
-                                resultDiv.innerHTML = `
-                                    <div style="margin-top: 15px; padding: 10px; background: white; border-radius: 4px;">
-                                        <h4>${symbol} Analysis</h4>
-                                        <p><strong>Verdict:</strong> <span style="color: ${verdictColor};">${data.verdict}</span></p>
-                                        <p><strong>Confidence:</strong> ${(data.confidence * 100).toFixed(0)}%</p>
-                                        <p><strong>Reasoning:</strong> ${data.reasoning}</p>
-                                    </div>
-                                `;
-                            })
-                            .catch(error => {
-                                resultDiv.innerHTML = '<p style="color: red;">Analysis failed</p>';
-                                console.error('Error:', error);
-                            });
-                    }
-                    
-                    // Auto-refresh every 30 seconds
-                    setInterval(refreshData, 30000);
-                    
-                    // Initial load
-                    refreshData();
-                    updateUserProfile();
-                </script>
-            </body>
-            </html>
-            '''
+            return _INDEX_HTML
         
         @self.app.route('/api/status')
+        @_etag_response
         def api_status():
             """API endpoint for system status"""
             return jsonify({
                 'timestamp': datetime.now().isoformat(),
                 'status': 'active',
-                'mock_mode': self.config.system.mock_mode,
-                'market_hours': self.config.is_market_hours(),
+                'mock_mode': config.system.mock_mode,
+                'market_hours': config.is_market_hours(),
                 'system_health': 'operational'
             })
         
         @self.app.route('/api/auth/check-cookies')
+        @_etag_response(max_age=30)
         def api_auth_check_cookies():
             """Check if user has valid authentication cookies"""
             try:
-                from flask import request
-                
                 request_token = request.cookies.get('kite_request_token')
                 access_token = request.cookies.get('kite_access_token')
                 auth_timestamp = request.cookies.get('kite_auth_timestamp')
                 
+                # Reject malformed cookies before touching the profile cache or Kite
+                if access_token and not _plausible_token(access_token):
+                    return _json_bytes(_AUTH_TOKEN_INVALID)
+                
                 if request_token and access_token and auth_timestamp:
                     # Check if tokens are still valid (30 days)
                     auth_time = datetime.fromtimestamp(int(auth_timestamp))
@@ -545,13 +879,8 @@ class WebDashboard:
                         
                         # Verify token by checking if it can be used
                         try:
-                            from kiteconnect import KiteConnect
-                            api_key = self.config.zerodha.api_key
-                            kite = KiteConnect(api_key=api_key)
-                            kite.set_access_token(access_token)
-                            
-                            # Quick test to verify token validity
-                            profile = kite.profile()
+                            # Profile is Kite's smallest authenticated endpoint (cached for a few minutes)
+                            profile = cached_profile(access_token) or fetch_profile(access_token)
                             
                             return jsonify({
                                 'authenticated': True,
@@ -562,27 +891,15 @@ class WebDashboard:
                             })
                             
                         except Exception as token_error:
-                            logger.warning(f"Stored token invalid: {token_error}")
-                            return jsonify({
-                                'authenticated': False,
-                                'reason': 'Token validation failed',
-                                'need_reauth': True
-                            })
+                            logger.warning("Stored token invalid: %s", token_error)
+                            return _json_bytes(_AUTH_TOKEN_INVALID)
                     else:
-                        return jsonify({
-                            'authenticated': False,
-                            'reason': 'Tokens expired',
-                            'need_reauth': True
-                        })
+                        return _json_bytes(_AUTH_TOKENS_EXPIRED)
                 else:
-                    return jsonify({
-                        'authenticated': False,
-                        'reason': 'No stored tokens found',
-                        'need_reauth': True
-                    })
+                    return _json_bytes(_AUTH_NO_TOKENS)
                     
             except Exception as e:
-                logger.error(f"Cookie auth check error: {e}")
+                logger.error("Cookie auth check error: %s", e)
                 return jsonify({
                     'authenticated': False,
                     'error': str(e),
@@ -593,23 +910,17 @@ class WebDashboard:
         def api_auth_logout():
             """Logout endpoint to clear authentication cookies and .env tokens"""
             try:
-                from flask import make_response
-                
                 # Clear .env file tokens
                 env_path = '.env'
-                if os.path.exists(env_path):
-                    with open(env_path, 'r') as f:
-                        lines = f.readlines()
-                    
-                    # Clear tokens in .env
-                    for i, line in enumerate(lines):
-                        if line.startswith('KITE_REQUEST_TOKEN='):
-                            lines[i] = 'KITE_REQUEST_TOKEN=\n'
-                        elif line.startswith('KITE_ACCESS_TOKEN='):
-                            lines[i] = 'KITE_ACCESS_TOKEN=\n'
-                    
-                    with open(env_path, 'w') as f:
-                        f.writelines(lines)
+                if os.path.exists(env_path) and os.path.getsize(env_path) > 0:
+                    # Clear tokens in .env in place: values are blanked with spaces (same length,
+                    # so nothing else is rewritten) and dotenv strips the padding when reading
+                    with open(env_path, 'r+b') as f, mmap.mmap(f.fileno(), 0) as env:
+                        spans = [match.span(2) for match in _ENV_TOKEN_RE.finditer(env)]
+                        for start, end in spans:
+                            env[start:end] = b' ' * (end - start)
+                        if spans:
+                            env.flush()
                 
                 # Create response
                 response = make_response(jsonify({
@@ -626,50 +937,35 @@ class WebDashboard:
                 return response
                 
             except Exception as e:
-                logger.error(f"Logout error: {e}")
+                logger.error("Logout error: %s", e)
                 return jsonify({'error': str(e)}), 500
         
         @self.app.route('/api/auth/login-url')
+        @_etag_response
         def api_auth_login_url():
             """Generate Kite Connect login URL"""
             try:
-                api_key = self.config.zerodha.api_key
-                if api_key and api_key != 'your_api_key_here':
-                    login_url = f'https://kite.zerodha.com/connect/login?api_key={api_key}&v=3'
-                    return jsonify({
-                        'login_url': login_url,
-                        'instructions': {
-                            'step1': 'Click the login URL to authenticate with Zerodha',
-                            'step2': 'You will be redirected back automatically after login',
-                            'step3': 'Refresh this page to see your real holdings'
-                        }
-                    })
+                if self._login_url_body:
+                    return _json_bytes(self._login_url_body)
                 else:
                     return jsonify({'error': 'API key not configured'}), 400
             except Exception as e:
-                logger.error(f"Login URL generation error: {e}")
+                logger.error("Login URL generation error: %s", e)
                 return jsonify({'error': str(e)}), 500
         
         @self.app.route('/api/profile')
+        @_etag_response(max_age=30)
         def api_profile():
             """Get user profile information"""
             try:
-                from flask import request
-                
                 # Try to get access token from cookies
                 access_token = request.cookies.get('kite_access_token')
                 user_info_cookie = request.cookies.get('kite_user_info')
                 
                 if access_token:
                     try:
-                        # Create temporary Kite session with cookie token
-                        from kiteconnect import KiteConnect
-                        api_key = self.config.zerodha.api_key
-                        kite = KiteConnect(api_key=api_key)
-                        kite.set_access_token(access_token)
-                        
-                        # Get fresh profile data
-                        profile = kite.profile()
+                        # Profile for this token (cached for a few minutes)
+                        profile = cached_profile(access_token) or fetch_profile(access_token)
                         return jsonify({
                             'authenticated': True,
                             'profile': profile,
@@ -680,17 +976,17 @@ class WebDashboard:
                         })
                         
                     except Exception as e:
-                        logger.warning(f"Failed to fetch profile with cookie token: {e}")
+                        logger.warning("Failed to fetch profile with cookie token: %s", e)
                         # Fallback to cached user info
                         if user_info_cookie:
                             try:
-                                user_info = json.loads(user_info_cookie)
+                                user_info = UserInfo.from_cookie(user_info_cookie)
                                 return jsonify({
                                     'authenticated': True,
-                                    'profile': user_info,
-                                    'user_name': user_info.get('user_name', 'Unknown'),
-                                    'user_id': user_info.get('user_id', 'Unknown'),
-                                    'email': user_info.get('email', 'Unknown'),
+                                    'profile': asdict(user_info),
+                                    'user_name': user_info.user_name,
+                                    'user_id': user_info.user_id,
+                                    'email': user_info.email,
                                     'cached': True
                                 })
                             except:
@@ -702,59 +998,57 @@ class WebDashboard:
                 })
                 
             except Exception as e:
-                logger.error(f"Profile API error: {e}")
+                logger.error("Profile API error: %s", e)
                 return jsonify({'error': str(e)}), 500
         
         @self.app.route('/api/portfolio')
+        @_etag_response
         def api_portfolio():
             """API endpoint for portfolio data"""
             try:
-                from flask import request
-                
                 # Try to get access token from cookies first
                 access_token = request.cookies.get('kite_access_token')
                 
                 if access_token and self.governor:
                     # Use the Governor's built-in token support
-                    portfolio_data = self.governor.audit_risk(access_token=access_token)
+                    payload = portfolio_payload(access_token)
                     logger.info("Portfolio data fetched using cookie authentication")
-                    return jsonify(portfolio_data)
+                    return _json_bytes(payload)
                 
                 # Fallback to regular governor (might be mock mode)
                 if self.governor:
-                    portfolio_data = self.governor.audit_risk()
-                    return jsonify(portfolio_data)
+                    return _json_bytes(portfolio_payload(None))
                 else:
                     return jsonify({'error': 'Governor not initialized'}), 500
                     
             except Exception as e:
-                logger.error(f"Portfolio API error: {e}")
+                logger.error("Portfolio API error: %s", e)
                 return jsonify({'error': str(e)}), 500
         
         @self.app.route('/api/analyze/<symbol>')
+        @_etag_response
         def api_analyze(symbol):
             """API endpoint for stock analysis"""
             try:
-                if self.scout:
-                    result = self.scout.analyze_ticker(symbol, 'web_request')
+                if scout:
+                    result = scout.analyze_ticker(symbol, 'web_request')
                     return jsonify({
                         'symbol': result.symbol,
                         'verdict': result.verdict.value,
                         'confidence': result.confidence,
                         'reasoning': result.reasoning,
-                        'timestamp': result.timestamp.isoformat()
+                        'timestamp': result.timestamp
                     })
                 else:
                     return jsonify({'error': 'Scout not initialized'}), 500
             except Exception as e:
-                logger.error(f"Analysis API error: {e}")
+                logger.error("Analysis API error: %s", e)
                 return jsonify({'error': str(e)}), 500
         
         @self.app.route('/auth/callback')
         def auth_callback():
             """Handle Kite Connect authentication callback"""
             try:
-                from flask import request, make_response
                 request_token = request.args.get('request_token')
                 status = request.args.get('status')
                 
@@ -763,212 +1057,130 @@ class WebDashboard:
                     access_token = None
                     user_profile = None
                     try:
-                        from kiteconnect import KiteConnect
-                        api_key = self.config.zerodha.api_key
-                        api_secret = self.config.zerodha.api_secret
-                        
-                        kite = KiteConnect(api_key=api_key)
-                        data = kite.generate_session(request_token, api_secret=api_secret)
+                        kite = KiteConnect(api_key=self._api_key)
+                        data = kite.generate_session(request_token, api_secret=self._api_secret)
                         access_token = data['access_token']
                         
                         # Get user profile
                         kite.set_access_token(access_token)
                         user_profile = kite.profile()
                         
-                        logger.info(f"✅ Access token generated for user: {user_profile.get('user_name', 'Unknown')}")
+                        # Seed the per-token caches so the dashboard's first polls reuse this client and profile
+                        with self._cache_lock:
+                            self._kite_clients[access_token] = kite
+                            self._profile_cache[access_token] = user_profile
+                        
+                        logger.info("✅ Access token generated for user: %s", user_profile.get('user_name', 'Unknown'))
                     except Exception as token_error:
-                        logger.error(f"Failed to generate access token: {token_error}")
-                        return make_response(f'''
-                        <!DOCTYPE html>
-                        <html>
-                        <head>
-                            <title>Authentication Failed</title>
-                            <style>
-                                body {{ 
-                                    font-family: Arial, sans-serif; 
-                                    padding: 40px; 
-                                    text-align: center; 
-                                    background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
-                                    color: white;
-                                    min-height: 100vh;
-                                    margin: 0;
-                                    display: flex;
-                                    align-items: center;
-                                    justify-content: center;
-                                }}
-                                .container {{
-                                    background: rgba(255,255,255,0.1);
-                                    padding: 30px;
-                                    border-radius: 10px;
-                                    backdrop-filter: blur(10px);
-                                    box-shadow: 0 10px 30px rgba(0,0,0,0.3);
-                                }}
-                            </style>
-                        </head>
-                        <body>
-                            <div class="container">
-                                <h1>❌ Authentication Failed</h1>
-                                <p>Failed to generate access token.</p>
-                                <p>Error: {token_error}</p>
-                                <button onclick="window.close()" style="padding: 10px 20px; background: white; color: #c0392b; border: none; border-radius: 5px; cursor: pointer;">Close Window</button>
-                            </div>
-                        </body>
-                        </html>
-                        ''')
+                        logger.error("Failed to generate access token: %s", token_error)
+                        return make_response(_AUTH_TOKEN_FAILED_TPL.safe_substitute(token_error=escape(str(token_error))))
                     
                     if access_token:
                         # Create response with success page
-                        response_html = f'''
-                        <!DOCTYPE html>
-                        <html>
-                        <head>
-                            <title>Authentication Success</title>
-                            <style>
-                                body {{ 
-                                    font-family: Arial, sans-serif; 
-                                    padding: 40px; 
-                                    text-align: center; 
-                                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                                    color: white;
-                                    min-height: 100vh;
-                                    margin: 0;
-                                    display: flex;
-                                    align-items: center;
-                                    justify-content: center;
-                                }}
-                                .container {{
-                                    background: rgba(255,255,255,0.1);
-                                    padding: 30px;
-                                    border-radius: 10px;
-                                    backdrop-filter: blur(10px);
-                                    box-shadow: 0 10px 30px rgba(0,0,0,0.3);
-                                }}
-                            </style>
-                        </head>
-                        <body>
-                            <div class="container">
-                                <h1>🎉 Authentication Successful!</h1>
-                                <p>Welcome, {user_profile.get('user_name', 'User') if user_profile else 'User'}!</p>
-                                <p><strong>User ID:</strong> {user_profile.get('user_id', 'Unknown') if user_profile else 'Unknown'}</p>
-                                <p>🔐 Authentication tokens securely stored in cookies.</p>
-                                <p>The dashboard will now use your real holdings.</p>
-                                <p><small>This window will close automatically in 3 seconds...</small></p>
-                                <script>
-                                    setTimeout(() => {{
-                                        window.close();
-                                        // If window doesn't close (some browsers), redirect to dashboard
-                                        if (!window.closed) {{
-                                            window.location.href = '/';
-                                        }}
-                                    }}, 3000);
-                                </script>
-                            </div>
-                        </body>
-                        </html>
-                        '''
+                        response_html = _AUTH_SUCCESS_TPL.safe_substitute(
+                            user_name=escape(user_profile.get('user_name', 'User') if user_profile else 'User'),
+                            user_id=escape(user_profile.get('user_id', 'Unknown') if user_profile else 'Unknown')
+                        )
                         
                         # Create response with cookies (NO .env storage)
                         response = make_response(response_html)
                         
-                        # Set secure cookies with 30-day expiration
-                        expire_date = datetime.now() + timedelta(days=30)
-                        
-                        response.set_cookie(
-                            'kite_request_token', 
-                            request_token, 
-                            expires=expire_date,
-                            httponly=True,
-                            secure=False,  # Set to True in production with HTTPS
-                            samesite='Lax',
-                            path='/'
-                        )
-                        
-                        response.set_cookie(
-                            'kite_access_token', 
-                            access_token, 
-                            expires=expire_date,
-                            httponly=True,
-                            secure=False,  # Set to True in production with HTTPS
-                            samesite='Lax',
-                            path='/'
-                        )
+                        # Set cookies with 30-day expiration (one shared Expires value)
+                        expires = self._cookie_expiry()
                         
-                        response.set_cookie(
-                            'kite_auth_timestamp', 
-                            str(int(datetime.now().timestamp())), 
-                            expires=expire_date,
-                            httponly=False,  # Allow JS access for timestamp checks
-                            secure=False,
-                            samesite='Lax',
-                            path='/'
-                        )
+                        response.headers.add('Set-Cookie', _cookie_header('kite_request_token', request_token, expires, httponly=True))
+                        response.headers.add('Set-Cookie', _cookie_header('kite_access_token', access_token, expires, httponly=True))
+                        # Allow JS access for timestamp checks
+                        response.headers.add('Set-Cookie', _cookie_header('kite_auth_timestamp', str(int(time.time())), expires, httponly=False))
                         
-                        # Store user info in cookie for display
+                        # Store user info in cookie for display (JS-readable)
                         if user_profile:
-                            response.set_cookie(
-                                'kite_user_info', 
-                                json.dumps({
-                                    'user_name': user_profile.get('user_name', 'Unknown'),
-                                    'user_id': user_profile.get('user_id', 'Unknown'),
-                                    'email': user_profile.get('email', 'Unknown')
-                                }), 
-                                expires=expire_date,
-                                httponly=False,  # Allow JS access for display
-                                secure=False,
-                                samesite='Lax',
-                                path='/'
+                            user_info = UserInfo(
+                                user_name=user_profile.get('user_name', 'Unknown'),
+                                user_id=user_profile.get('user_id', 'Unknown'),
+                                email=user_profile.get('email', 'Unknown')
                             )
+                            response.headers.add('Set-Cookie', _cookie_header('kite_user_info', user_info.to_cookie(), expires, httponly=False))
                         
-                        logger.info(f"✅ Authentication successful! Tokens stored in cookies only")
+                        logger.info("✅ Authentication successful! Tokens stored in cookies only")
                         return response
                     
                 else:
-                    logger.error(f"Authentication failed: {request.args}")
-                    error_html = '''
-                    <!DOCTYPE html>
-                    <html>
-                    <head>
-                        <title>Authentication Failed</title>
-                        <style>
-                            body {{ 
-                                font-family: Arial, sans-serif; 
-                                padding: 40px; 
-                                text-align: center; 
-                                background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
-                                color: white;
-                                min-height: 100vh;
-                                margin: 0;
-                                display: flex;
-                                align-items: center;
-                                justify-content: center;
-                            }}
-                            .container {{
-                                background: rgba(255,255,255,0.1);
-                                padding: 30px;
-                                border-radius: 10px;
-                                backdrop-filter: blur(10px);
-                                box-shadow: 0 10px 30px rgba(0,0,0,0.3);
-                            }}
-                        </style>
-                    </head>
-                    <body>
-                        <div class="container">
-                            <h1>❌ Authentication Failed</h1>
-                            <p>There was an error with the authentication process.</p>
-                            <p>Please try again or check your credentials.</p>
-                            <button onclick="window.close()" style="padding: 10px 20px; background: white; color: #c0392b; border: none; border-radius: 5px; cursor: pointer;">Close Window</button>
-                        </div>
-                    </body>
-                    </html>
-                    '''
-                    return make_response(error_html)
+                    logger.error("Authentication failed: %s", request.args)
+                    return make_response(_AUTH_FAILED_HTML)
                     
             except Exception as e:
-                logger.error(f"Auth callback error: {e}")
+                logger.error("Auth callback error: %s", e)
                 return jsonify({'error': str(e)}), 500
     
+    def _build_login_url_body(self) -> Optional[bytes]:
+        """Serialized /api/auth/login-url payload, or None if no API key is configured"""
+        api_key = self._api_key
+        if not api_key or api_key == 'your_api_key_here':
+            return None
+        
+        return orjson.dumps({
+            'login_url': f'https://kite.zerodha.com/connect/login?api_key={api_key}&v=3',
+            'instructions': {
+                'step1': 'Click the login URL to authenticate with Zerodha',
+                'step2': 'You will be redirected back automatically after login',
+                'step3': 'Refresh this page to see your real holdings'
+            }
+        })
+    
+    def _cookie_expiry(self) -> str:
+        """Expires value for 30-day auth cookies, reformatted at most once a minute"""
+        now = time.time()
+        formatted_at, value = self._cookie_expiry_cache
+        if now - formatted_at >= 60:
+            value = http_date(now + _COOKIE_MAX_AGE)
+            self._cookie_expiry_cache = (now, value)
+        return value
+    
+    def _get_kite(self, access_token: str) -> KiteConnect:
+        """Reuse one KiteConnect client per access token"""
+        with self._cache_lock:
+            kite = self._kite_clients.get(access_token)
+        
+        if kite is None:
+            kite = KiteConnect(api_key=self._api_key)
+            kite.set_access_token(access_token)
+            with self._cache_lock:
+                self._kite_clients[access_token] = kite
+        return kite
+    
+    def _cached_profile(self, access_token: str) -> Optional[Dict]:
+        """Profile fetched for this token within the cache TTL, if any"""
+        with self._cache_lock:
+            return self._profile_cache.get(access_token)
+    
+    def _fetch_profile(self, access_token: str) -> Dict:
+        """Fetch the Kite profile for a token and cache it (raises if the token is rejected)"""
+        profile = self._get_kite(access_token).profile()
+        with self._cache_lock:
+            self._profile_cache[access_token] = profile
+        return profile
+    
+    def _portfolio_payload(self, access_token: Optional[str]) -> bytes:
+        """Serialized Governor risk audit for a token (or the default session), cached briefly"""
+        key = access_token or ''
+        with self._cache_lock:
+            payload = self._portfolio_cache.get(key)
+        
+        if payload is None:
+            portfolio_data = _add_holdings_html(self.governor.audit_risk(access_token=access_token))
+            payload = orjson.dumps(portfolio_data, default=orjson_default, option=ORJSON_OPTIONS)
+            if portfolio_data.get('status') != 'ERROR':
+                with self._cache_lock:
+                    self._portfolio_cache[key] = payload
+        return payload
+    
     def _initialize_system(self):
         """Initialize system components"""
+        # Zerodha credentials never change after startup; keep them off the config lookup chain
+        self._api_key = self.config.zerodha.api_key
+        self._api_secret = self.config.zerodha.api_secret
+        
         try:
             logger.info("Initializing Mosaic Vault web system...")
             
@@ -1006,7 +1218,8 @@ class WebDashboard:
         try:
             logger.info(f"🌐 Starting Mosaic Vault Web Dashboard")
             logger.info(f"🔗 Open your browser to: http://localhost:{self.port}")
-            self.app.run(host='0.0.0.0', port=self.port, debug=self.debug)
+            # Threaded development server; production runs wsgi:app under gunicorn's gthread workers
+            self.app.run(host='0.0.0.0', port=self.port, debug=self.debug, threaded=True)
         except KeyboardInterrupt:
             logger.info("Web dashboard stopped by user")
         except Exception as e:
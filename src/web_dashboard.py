@@ -3,31 +3,142 @@ Mosaic Vault - Web Dashboard
 Flask-based web interface with real-time updates.
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
+from flask_socketio import SocketIO, emit
+import atexit
+import hashlib
 import threading
 import time
-import json
 from datetime import datetime
 import os
-import sys
 import logging
-from typing import Dict, List, Optional
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
 
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__)))
+import numpy as np
+import orjson
+from cachetools import TTLCache
 
 from core.auth import get_kite_session
+from core.web import OrjsonProvider, setup_compression
 from agents.governor import Governor
-from agents.scout import Scout
+from agents.scout import AnalysisVerdict, Scout
+from config import get_config, setup_logging
+from aggregates import portfolio_stats, warm_up as warm_up_aggregates
 
 # Configure logger
 logger = logging.getLogger(__name__)
-from agents.scout import Scout
-from config import get_config
 
 # Configure logging
 logging.getLogger('werkzeug').setLevel(logging.ERROR)
 
+def _queue_root_logging() -> Optional[QueueListener]:
+    """
+    Put the root logger's handlers behind a QueueListener so request handlers and the
+    update loop only enqueue records; stream/file I/O happens on the listener thread.
+    """
+    root = logging.getLogger()
+    handlers = [h for h in root.handlers if not isinstance(h, QueueHandler)]
+    if not handlers:
+        return None
+    
+    log_queue = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Drain whatever is still queued when the process exits
+    atexit.register(listener.stop)
+    return listener
+
+# Most symbols accepted by one /api/analyze_batch request
+_MAX_BATCH_SYMBOLS = 50
+
+# Seconds a serialized /api/portfolio body is served before the Governor is asked again
+_PORTFOLIO_TTL = 10
+
+# Numeric Holding fields, in column order for the struct-of-arrays view
+_HOLDING_FIELDS = ('quantity', 'avg_price', 'current_price', 'value', 'day_change',
+                   'day_change_pct', 'unrealized_pnl', 'unrealized_pnl_pct')
+_holding_values = attrgetter(*_HOLDING_FIELDS)
+
+def _holding_columns(holdings: List) -> Tuple[List[str], Dict[str, np.ndarray]]:
+    """Split holdings into their symbols and one contiguous float64 array per numeric field"""
+    symbols = [h.symbol for h in holdings]
+    matrix = np.array([_holding_values(h) for h in holdings], dtype=np.float64)
+    # One row per field, so each column is C-contiguous: the layout aggregates.warm_up compiles for
+    columns = np.ascontiguousarray(matrix.reshape(len(holdings), len(_HOLDING_FIELDS)).T)
+    return symbols, dict(zip(_HOLDING_FIELDS, columns))
+
+def _portfolio_stats(portfolio_value: float, columns: Dict[str, np.ndarray]) -> Dict:
+    """Portfolio totals, gainer/loser counts and top-mover indexes from one aggregates kernel call"""
+    total_investment, day_pnl, gainers_count, losers_count, top_gainer, top_loser = portfolio_stats(
+        columns['quantity'], columns['avg_price'], columns['day_change'],
+        columns['unrealized_pnl'], columns['unrealized_pnl_pct']
+    )
+    
+    return {
+        'total_investment': total_investment,
+        'total_pnl': portfolio_value - total_investment,
+        'total_pnl_pct': ((portfolio_value - total_investment) / total_investment) * 100 if total_investment > 0 else 0,
+        'day_pnl': day_pnl,
+        'day_pnl_pct': (day_pnl / portfolio_value) * 100 if portfolio_value > 0 else 0,
+        'gainers_count': gainers_count,
+        'losers_count': losers_count,
+        'top_gainer': top_gainer if top_gainer >= 0 else None,
+        'top_loser': top_loser if top_loser >= 0 else None
+    }
+
+def _holding_rows(symbols: List[str], columns: Dict[str, np.ndarray]) -> List[Dict]:
+    """Holdings as JSON rows, with every price/P&L column rounded to 2 places in one NumPy call each"""
+    rounded = [np.round(columns[field], 2).tolist() for field in _HOLDING_FIELDS[1:]]
+    quantities = columns['quantity'].astype(np.int64).tolist()
+    return [
+        {
+            'symbol': symbol,
+            'quantity': quantity,
+            'avg_price': avg_price,
+            'current_price': current_price,
+            'value': value,
+            'day_change': day_change,
+            'day_change_pct': day_change_pct,
+            'unrealized_pnl': unrealized_pnl,
+            'unrealized_pnl_pct': unrealized_pnl_pct
+        }
+        for symbol, quantity, avg_price, current_price, value, day_change, day_change_pct,
+            unrealized_pnl, unrealized_pnl_pct in zip(symbols, quantities, *rounded)
+    ]
+
+# Verdicts that usually mean the market data fetch failed, so they are never reused
+_UNCACHED_VERDICTS = frozenset({AnalysisVerdict.ERROR, AnalysisVerdict.INSUFFICIENT_DATA})
+
+_analysis_fields = attrgetter('symbol', 'verdict', 'confidence', 'reasoning', 'timestamp')
+
+def _analysis_dict(result) -> Dict:
+    """JSON body for a Scout AnalysisResult (timestamp stays a datetime for orjson)"""
+    symbol, verdict, confidence, reasoning, timestamp = _analysis_fields(result)
+    return {
+        'symbol': symbol,
+        'verdict': verdict.value,
+        'confidence': confidence,
+        'reasoning': reasoning,
+        'timestamp': timestamp
+    }
+
+def _top_mover(symbols: List[str], columns: Dict[str, np.ndarray], index: Optional[int]) -> Optional[Dict]:
+    """top_gainer / top_loser entry for the holding at index"""
+    if index is None:
+        return None
+    return {
+        'symbol': symbols[index],
+        'pnl_pct': round(float(columns['unrealized_pnl_pct'][index]), 2),
+        'pnl': round(float(columns['unrealized_pnl'][index]), 2)
+    }
+
 class WebDashboard:
     """
     Web-based Mosaic Vault dashboard
@@ -37,6 +148,12 @@ class WebDashboard:
         self.app = Flask(__name__, template_folder='templates', static_folder='static')
         self.app.config['SECRET_KEY'] = 'mosaic-vault-secret-key'
         
+        # orjson-backed jsonify: compact, unsorted, and datetimes/NumPy values encoded in C
+        self.app.json = OrjsonProvider(self.app)
+        # Socket.IO packets go through the same provider (str-returning dumps/loads, as python-socketio expects)
+        self.socketio = SocketIO(self.app, json=self.app.json)
+        setup_compression(self.app)
+        
         # Initialize system components
         self.config = get_config()
         self.kite_session = None
@@ -45,12 +162,26 @@ class WebDashboard:
         self.port = port
         self.debug = debug
         
+        # Dashboard page, rendered once in _initialize_system (the template takes no context)
+        self._index_html: Optional[bytes] = None
+        
         # Dashboard state
         self.portfolio_data = {}
         self.is_running = False
+        self.last_zone: Optional[str] = None
+        
+        # Serialized /api/portfolio body and its ETag, shared by every client until it goes stale
+        self._portfolio_cache: Optional[Tuple[bytes, str]] = None
+        self._portfolio_cache_ts = float('-inf')
+        self._portfolio_lock = threading.Lock()
+        
+        # Recent Scout results per symbol, so repeat clicks and other tabs within a minute reuse them
+        self._analysis_cache = TTLCache(maxsize=1024, ttl=60)
+        self._analysis_lock = threading.Lock()
         
         # Setup routes
         self._setup_routes()
+        self._setup_socketio_events()
         self._initialize_system()
     
     def _setup_routes(self):
@@ -58,12 +189,14 @@ class WebDashboard:
         
         @self.app.route('/')
         def index():
-            return render_template('dashboard.html')
+            if self._index_html is None:
+                return render_template('dashboard.html')
+            return Response(self._index_html, mimetype='text/html')
         
         @self.app.route('/api/status')
         def api_status():
             return jsonify({
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': datetime.now(),
                 'status': 'active',
                 'mock_mode': self.config.system.mock_mode,
                 'market_hours': self.config.is_market_hours(),
@@ -74,81 +207,46 @@ class WebDashboard:
         def api_portfolio():
             if self.governor:
                 try:
-                    # Get detailed portfolio data
-                    portfolio_value, holdings = self.governor.get_current_portfolio()
-                    status = self.governor.get_portfolio_status()
-                    
-                    # Calculate additional metrics
-                    total_investment = sum(h.quantity * h.avg_price for h in holdings) if holdings else 0
-                    total_pnl = portfolio_value - total_investment
-                    total_pnl_pct = (total_pnl / total_investment) * 100 if total_investment > 0 else 0
-                    
-                    # Day's performance
-                    day_pnl = sum(h.day_change * h.quantity for h in holdings) if holdings else 0
-                    day_pnl_pct = (day_pnl / portfolio_value) * 100 if portfolio_value > 0 else 0
-                    
-                    # Performance categorization
-                    gainers = [h for h in holdings if h.unrealized_pnl > 0] if holdings else []
-                    losers = [h for h in holdings if h.unrealized_pnl < 0] if holdings else []
-                    
-                    # Top performers
-                    top_gainer = max(gainers, key=lambda x: x.unrealized_pnl_pct) if gainers else None
-                    top_loser = min(losers, key=lambda x: x.unrealized_pnl_pct) if losers else None
-                    
-                    return jsonify({
-                        'portfolio_value': round(portfolio_value, 2),
-                        'total_investment': round(total_investment, 2),
-                        'total_pnl': round(total_pnl, 2),
-                        'total_pnl_pct': round(total_pnl_pct, 2),
-                        'day_pnl': round(day_pnl, 2),
-                        'day_pnl_pct': round(day_pnl_pct, 2),
-                        'holdings_count': len(holdings) if holdings else 0,
-                        'gainers_count': len(gainers),
-                        'losers_count': len(losers),
-                        'risk_zone': status.get('risk_zone', 'Unknown'),
-                        'floor_protection': status.get('floor_protection', False),
-                        'top_gainer': {
-                            'symbol': top_gainer.symbol,
-                            'pnl_pct': round(top_gainer.unrealized_pnl_pct, 2),
-                            'pnl': round(top_gainer.unrealized_pnl, 2)
-                        } if top_gainer else None,
-                        'top_loser': {
-                            'symbol': top_loser.symbol,
-                            'pnl_pct': round(top_loser.unrealized_pnl_pct, 2),
-                            'pnl': round(top_loser.unrealized_pnl, 2)
-                        } if top_loser else None,
-                        'holdings': [
-                            {
-                                'symbol': h.symbol,
-                                'quantity': h.quantity,
-                                'avg_price': round(h.avg_price, 2),
-                                'current_price': round(h.current_price, 2),
-                                'value': round(h.value, 2),
-                                'day_change': round(h.day_change, 2),
-                                'day_change_pct': round(h.day_change_pct, 2),
-                                'unrealized_pnl': round(h.unrealized_pnl, 2),
-                                'unrealized_pnl_pct': round(h.unrealized_pnl_pct, 2)
-                            } for h in holdings
-                        ] if holdings else [],
-                        'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    })
-                    
+                    body, etag = self._portfolio_payload()
+                    response = Response(body, mimetype='application/json')
+                    response.set_etag(etag, weak=True)
+                    response.cache_control.private = True
+                    response.cache_control.max_age = _PORTFOLIO_TTL
+                    # Repeat polls of an unchanged snapshot get a bodiless 304
+                    return response.make_conditional(request)
                 except Exception as e:
-                    logger.error(f"Error in portfolio API: {e}")
+                    logger.error("Error in portfolio API: %s", e)
                     return jsonify({'error': f'Portfolio fetch failed: {str(e)}'}), 500
             return jsonify({'error': 'Governor not initialized'})
         
         @self.app.route('/api/analyze/<symbol>')
         def api_analyze(symbol):
             try:
-                result = self.scout.analyze_ticker(symbol.upper(), 'web_request')
-                return jsonify({
-                    'symbol': result.symbol,
-                    'verdict': result.verdict.value,
-                    'confidence': result.confidence,
-                    'reasoning': result.reasoning,
-                    'timestamp': result.timestamp.isoformat()
-                })
+                result = self._analyze(symbol.upper(), 'web_request')
+                return jsonify(_analysis_dict(result))
+            except Exception as e:
+                return jsonify({'error': str(e)}), 500
+        
+        @self.app.route('/api/analyze_batch', methods=['GET', 'POST'])
+        def api_analyze_batch():
+            """Analyze many symbols in one request: POST {"symbols": [...]} or GET ?symbols=A,B,C"""
+            try:
+                if request.method == 'POST':
+                    body = request.get_json(silent=True)
+                    symbols = body.get('symbols') if isinstance(body, dict) else None
+                    if not isinstance(symbols, list):
+                        return jsonify({'error': 'Expected a JSON body {"symbols": [...]}'}), 400
+                else:
+                    symbols = request.args.get('symbols', '').split(',')
+                
+                symbols = [s.strip().upper() for s in symbols if isinstance(s, str) and s.strip()]
+                if not symbols:
+                    return jsonify({'error': 'No symbols provided'}), 400
+                if len(symbols) > _MAX_BATCH_SYMBOLS:
+                    return jsonify({'error': f'At most {_MAX_BATCH_SYMBOLS} symbols per request'}), 400
+                
+                results = self._analyze_many(symbols, 'web_request')
+                return jsonify([_analysis_dict(result) for result in results])
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
         
@@ -160,12 +258,81 @@ class WebDashboard:
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
     
+    def _build_portfolio_payload(self, holdings: Optional[List] = None) -> bytes:
+        """Serialized /api/portfolio body from the given holdings (fetched live when omitted)"""
+        if holdings is None:
+            portfolio_value, holdings = self.governor.get_current_portfolio()
+        else:
+            portfolio_value = sum(h.value for h in holdings)
+        status = self.governor.get_portfolio_status(portfolio_value)
+        
+        # Aggregate over per-field arrays instead of re-walking the Holding objects
+        holdings = holdings or []
+        symbols, columns = _holding_columns(holdings)
+        stats = _portfolio_stats(portfolio_value, columns)
+        
+        return orjson.dumps({
+            'portfolio_value': round(portfolio_value, 2),
+            'total_investment': round(stats['total_investment'], 2),
+            'total_pnl': round(stats['total_pnl'], 2),
+            'total_pnl_pct': round(stats['total_pnl_pct'], 2),
+            'day_pnl': round(stats['day_pnl'], 2),
+            'day_pnl_pct': round(stats['day_pnl_pct'], 2),
+            'holdings_count': len(holdings),
+            'gainers_count': stats['gainers_count'],
+            'losers_count': stats['losers_count'],
+            'risk_zone': status.get('risk_zone', 'Unknown'),
+            'floor_protection': status.get('floor_protection', False),
+            'top_gainer': _top_mover(symbols, columns, stats['top_gainer']),
+            'top_loser': _top_mover(symbols, columns, stats['top_loser']),
+            'holdings': _holding_rows(symbols, columns),
+            'last_updated': datetime.now().isoformat(sep=' ', timespec='seconds')
+        })
+    
+    def _portfolio_payload(self) -> Tuple[bytes, str]:
+        """Cached /api/portfolio body and ETag, rebuilt at most once per _PORTFOLIO_TTL across all clients"""
+        if time.monotonic() - self._portfolio_cache_ts < _PORTFOLIO_TTL:
+            return self._portfolio_cache
+        
+        with self._portfolio_lock:
+            # Another request may have refreshed it while we waited
+            if time.monotonic() - self._portfolio_cache_ts >= _PORTFOLIO_TTL:
+                self._refresh_portfolio_cache()
+            return self._portfolio_cache
+    
+    def _refresh_portfolio_cache(self, holdings: Optional[List] = None) -> None:
+        """Rebuild the cached /api/portfolio body and hash it once for its ETag"""
+        payload = self._build_portfolio_payload(holdings)
+        self._portfolio_cache = (payload, hashlib.blake2b(payload, digest_size=8).hexdigest())
+        self._portfolio_cache_ts = time.monotonic()
+    
+    def _analyze(self, symbol: str, trigger_event: str):
+        """Scout analysis for a symbol, reused for up to a minute"""
+        return self._analyze_many([symbol], trigger_event)[0]
+    
+    def _analyze_many(self, symbols: List[str], trigger_event: str) -> List:
+        """Scout analyses for unique symbols in order; only symbols without a recent result hit Scout"""
+        with self._analysis_lock:
+            results = {symbol: self._analysis_cache.get(symbol) for symbol in symbols}
+        
+        missing = [symbol for symbol, result in results.items() if result is None]
+        if missing:
+            fresh = self.scout.analyze_batch(missing, trigger_event)
+            with self._analysis_lock:
+                for symbol, result in zip(missing, fresh):
+                    results[symbol] = result
+                    # Failed or data-starved analyses are retried on the next request rather than served for a minute
+                    if result.verdict not in _UNCACHED_VERDICTS:
+                        self._analysis_cache[symbol] = result
+        
+        return list(results.values())
+    
     def _setup_socketio_events(self):
         """Setup WebSocket events"""
         
         @self.socketio.on('connect')
         def handle_connect():
-            print(f"Client connected: {request.sid}")
+            logger.debug("Client connected: %s", request.sid)
             # Send initial data
             if self.governor:
                 portfolio_data = self.governor.audit_risk()
@@ -173,83 +340,114 @@ class WebDashboard:
         
         @self.socketio.on('disconnect')
         def handle_disconnect():
-            print(f"Client disconnected: {request.sid}")
+            logger.debug("Client disconnected: %s", request.sid)
         
         @self.socketio.on('request_analysis')
         def handle_analysis_request(data):
             symbol = data.get('symbol', '').upper()
             if symbol:
                 try:
-                    result = self.scout.analyze_ticker(symbol, 'websocket_request')
-                    emit('analysis_result', {
-                        'symbol': result.symbol,
-                        'verdict': result.verdict.value,
-                        'confidence': result.confidence,
-                        'reasoning': result.reasoning,
-                        'timestamp': result.timestamp.isoformat()
-                    })
+                    result = self._analyze(symbol, 'websocket_request')
+                    emit('analysis_result', _analysis_dict(result))
                 except Exception as e:
                     emit('analysis_error', {'error': str(e)})
     
     def _initialize_system(self):
         """Initialize system components"""
         try:
-            print("🔧 Initializing Mosaic Vault web system...")
+            logger.info("🔧 Initializing Mosaic Vault web system...")
             
             # Try to get Kite session
             if not self.config.system.mock_mode:
                 try:
                     self.kite_session = get_kite_session()
-                    print("✅ Kite session established")
+                    logger.info("✅ Kite session established")
                 except Exception as e:
-                    print(f"⚠️ Kite authentication failed, using mock mode: {e}")
+                    logger.warning("⚠️ Kite authentication failed, using mock mode: %s", e)
                     self.config.system.mock_mode = True
             
             # Initialize Governor
             self.governor = Governor(self.kite_session)
-            print("✅ System initialized successfully")
+            
+            # Compile the portfolio aggregation kernel now rather than on the first request
+            warm_up_aggregates()
+            
+            with self.app.app_context():
+                self._index_html = render_template('dashboard.html').encode('utf-8')
+            logger.info("✅ System initialized successfully")
             
         except Exception as e:
-            print(f"❌ System initialization failed: {e}")
+            logger.error("❌ System initialization failed: %s", e)
+    
+    def _has_clients(self) -> bool:
+        """True if at least one browser is connected to the default namespace"""
+        return next(self.socketio.server.manager.get_participants('/', None), None) is not None
     
     def _update_data_loop(self):
-        """Background thread for real-time data updates"""
+        """SocketIO background task for real-time data updates"""
         while self.is_running:
             try:
+                # Nobody is watching: skip the audit and its serialization until someone connects
+                if not self._has_clients():
+                    self.socketio.sleep(10)
+                    continue
+                
                 if self.governor:
-                    # Get portfolio update
-                    portfolio_data = self.governor.audit_risk()
+                    # One holdings fetch per tick feeds both the socket push and the HTTP cache
+                    holdings = self.governor.fetch_live_holdings()
+                    portfolio_data = self.governor.audit_risk(holdings=holdings)
                     
                     # Emit to all connected clients
                     self.socketio.emit('portfolio_update', portfolio_data)
                     
                     # Check for risk zone changes
                     current_zone = portfolio_data.get('status', 'UNKNOWN')
-                    if hasattr(self, 'last_zone') and self.last_zone != current_zone:
+                    if self.last_zone is not None and self.last_zone != current_zone:
                         self.socketio.emit('zone_change', {
                             'old_zone': self.last_zone,
                             'new_zone': current_zone,
                             'portfolio_value': portfolio_data.get('total_value', 0),
-                            'timestamp': datetime.now().isoformat()
+                            'timestamp': datetime.now()
                         })
                     
                     self.last_zone = current_zone
+                    
+                    # Refresh the HTTP payload on the same tick so polling clients never rebuild it;
+                    # a failure here must not hold up the socket push above
+                    try:
+                        with self._portfolio_lock:
+                            self._refresh_portfolio_cache(holdings)
+                    except Exception as e:
+                        logger.warning("Portfolio cache refresh failed: %s", e)
                 
                 # Sleep for update interval
-                time.sleep(10)  # Update every 10 seconds for web
+                self.socketio.sleep(10)  # Update every 10 seconds for web
                 
             except Exception as e:
-                print(f"❌ Data update error: {e}")
-                time.sleep(30)  # Wait longer on error
+                logger.error("❌ Data update error: %s", e)
+                self.socketio.sleep(30)  # Wait longer on error
+    
+    def start_background_updates(self):
+        """
+        Start the real-time update task (cooperative under eventlet/gevent, a thread otherwise).
+        Called by both run() and wsgi_realtime, so logging is moved behind the queue here too.
+        """
+        if self.is_running:
+            return
+        _queue_root_logging()
+        self.is_running = True
+        self.update_thread = self.socketio.start_background_task(self._update_data_loop)
     
     def run(self):
         """Start the web dashboard"""
-        print(f"🚀 Starting Mosaic Vault Web Dashboard on http://localhost:{self.port}")
+        logger.info("🚀 Starting Mosaic Vault Web Dashboard on http://localhost:%s", self.port)
         
-        # Start background update thread
-        self.is_running = True
-        self.update_thread = threading.Thread(target=self._update_data_loop, daemon=True)
-        self.update_thread.start()
+        self.start_background_updates()
+        
+        # socketio.run serves from eventlet/gevent when installed; only threading mode uses Werkzeug
+        if self.socketio.async_mode == 'threading' and not self.debug:
+            logger.warning("eventlet/gevent not installed - falling back to the Werkzeug development server "
+                           "(use wsgi_realtime.py under gunicorn in production)")
         
         # Create templates directory if it doesn't exist
         os.makedirs(os.path.join(os.path.dirname(__file__), 'templates'), exist_ok=True)
@@ -265,10 +463,11 @@ class WebDashboard:
                 allow_unsafe_werkzeug=True
             )
         except KeyboardInterrupt:
-            print("\\n🛑 Shutting down web dashboard...")
+            logger.info("🛑 Shutting down web dashboard...")
         finally:
             self.is_running = False
 
 if __name__ == "__main__":
+    setup_logging()
     dashboard = WebDashboard(port=5000, debug=True)
     dashboard.run()
\ No newline at end of file
@@ -0,0 +1,17 @@
+"""
+Mosaic Vault - WSGI Entry Point
+Builds the web dashboard once at import so gunicorn --preload can share it across workers.
+
+Usage:
+    gunicorn --chdir src --preload -k gthread -w 4 --threads 8 wsgi:app
+"""
+
+from config import setup_logging
+from simple_web import WebDashboard
+
+setup_logging()
+
+# Heavy initialization (config, Scout, Governor) runs once in the gunicorn master;
+# forked workers share it copy-on-write.
+dashboard = WebDashboard()
+app = dashboard.app
@@ -0,0 +1,18 @@
+"""
+Mosaic Vault - Real-time Dashboard WSGI Entry Point
+Serves web_dashboard (Flask + Socket.IO) from a cooperative gunicorn worker.
+
+Usage:
+    gunicorn --chdir src -k gevent -w 1 --worker-connections 1000 wsgi_realtime:app
+"""
+
+from config import setup_logging
+from web_dashboard import WebDashboard
+
+setup_logging()
+
+# One worker: Socket.IO sessions live in process memory, so more workers would need
+# sticky sessions and a message queue. Concurrency comes from the gevent hub instead.
+dashboard = WebDashboard()
+dashboard.start_background_updates()
+app = dashboard.app